@@ -0,0 +1,53 @@
+"""Import time of the maze modules, each measured in a fresh interpreter.
+
+Run from the repository root:
+    python benchmarks/import_time.py [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+MODULES = ("maze.maze", "maze.algorithm", "maze.maze_factory", "maze.batch")
+
+MEASURE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start, "matplotlib" in sys.modules)
+"""
+
+
+def import_time(module: str, runs: int) -> dict:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "PYTHONPATH": root}
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", MEASURE.format(module=module)],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        timings.append(float(output[0]))
+    return {
+        "module": module,
+        "median_ms": round(1000 * statistics.median(timings), 1),
+        "min_ms": round(1000 * min(timings), 1),
+        "imports_matplotlib": output[1] == "True",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps([import_time(module, args.runs) for module in MODULES], indent=2))
+
+
+if __name__ == "__main__":
+    main()
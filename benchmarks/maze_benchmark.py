@@ -0,0 +1,207 @@
+"""Benchmarks generating, storing, loading, solving and rendering seeded mazes.
+
+Every factory generates one maze per size, which is then exported and imported
+as text and binary file, built from its config and solved by every algorithm.
+Timings (seconds, best of --repeat runs) and counters are written as JSON.
+
+Run from the repository root:
+    python benchmarks/maze_benchmark.py --sizes 10 100 1000 --output bench.json
+
+With --memory the peak traced memory of every step is recorded as well, the
+timings then include the overhead of tracemalloc.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+# run as a script from anywhere, the package lives one directory up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze.grid import Grid
+from maze.maze import Maze
+from maze.maze_factory import DFSMaze, KruskalMaze, WilsonMaze, EllerMaze
+from maze.algorithm import (
+    MazeSolver,
+    DFSAlgorithm,
+    BFSAlgorithm,
+    AStarAlgorithm,
+    GreedyBestFirstAlgorithm,
+    BidirectionalBFSAlgorithm,
+    JunctionGraphAlgorithm,
+    LifelongAStarAlgorithm,
+)
+from maze.stats import SolveStats
+
+try:
+    from maze.render import write_png
+except ImportError:
+    write_png = None
+
+# number of cells per side of the generated mazes, the grid has 2 * size - 1
+SIZES = (10, 50, 100, 500, 1000, 2000, 4000)
+FACTORIES = {
+    factory.__name__: factory
+    for factory in (DFSMaze, KruskalMaze, WilsonMaze, EllerMaze)
+}
+ALGORITHMS = {
+    algorithm.__name__: algorithm
+    for algorithm in (
+        DFSAlgorithm,
+        BFSAlgorithm,
+        AStarAlgorithm,
+        GreedyBestFirstAlgorithm,
+        BidirectionalBFSAlgorithm,
+        JunctionGraphAlgorithm,
+        LifelongAStarAlgorithm,
+    )
+}
+
+
+def measure(
+    name: str,
+    function: Callable,
+    repeat: int = 1,
+    track_memory: bool = False,
+    setup: Callable = None,
+):
+    """Runs function (with the result of setup, if given) repeat times.
+
+    Returns the last result and {"seconds": best time, "peak_memory": bytes}."""
+    stats = SolveStats(track_memory=track_memory)
+    best = None
+    for _ in range(repeat):
+        args = (setup(),) if setup is not None else ()
+        stats.phases.clear()
+        with stats.phase(name):
+            result = function(*args)
+        best = min(best, stats.phases[name]) if best is not None else stats.phases[name]
+    return result, {"seconds": best, "peak_memory": stats.peak_memory}
+
+
+def solve(
+    grid: Grid, algorithm, repeat: int = 1, track_memory: bool = False
+) -> Dict[str, object]:
+    """Solves a fresh maze of grid per run, LifelongAStarAlgorithm would only
+    repair its previous search otherwise"""
+    best: Optional[dict] = None
+    for _ in range(repeat):
+        maze = Maze.from_grid(Grid(grid.width, grid.length, bytearray(grid.values)))
+        stats = SolveStats(track_memory=track_memory)
+        maze_solver = MazeSolver(maze, algorithm, stats)
+        maze_solver.solve_maze()
+        with stats.phase("view preparation"):
+            maze_solver.plot_dict("solution")
+            maze_solver.plot_dict("full")
+        result = stats.as_dict()
+        result["solution_length"] = len(maze_solver.solution_path)
+        if best is None:
+            best = result
+        else:
+            for phase, seconds in result["phases"].items():
+                best["phases"][phase] = min(best["phases"][phase], seconds)
+    return best
+
+
+def benchmark_maze(
+    factory_name: str,
+    size: int,
+    seed: int,
+    algorithms: List[str],
+    directory: str,
+    repeat: int = 1,
+    track_memory: bool = False,
+) -> Dict[str, object]:
+    factory = FACTORIES[factory_name]
+    steps = {}
+
+    def record(name, function, setup=None):
+        result, steps[name] = measure(name, function, repeat, track_memory, setup)
+        return result
+
+    def generate(maze_generator):
+        maze_generator.create_maze()
+        return maze_generator
+
+    maze_generator = record(
+        "generate", generate, setup=lambda: factory(size, size, seed)
+    )
+    config = record("maze_list", maze_generator.maze_list)
+    maze = record("Maze.__init__", lambda: Maze(config))
+    del config
+    for ending in ("txt", "maze"):
+        filename = os.path.join(directory, f"benchmark.{ending}")
+        record(f"export {ending}", lambda: maze.export_maze(filename))
+        record(f"import {ending}", lambda: Maze.import_maze(filename))
+        steps[f"export {ending}"]["bytes"] = os.path.getsize(filename)
+        os.remove(filename)
+    grid = maze.grid
+    results = {
+        name: solve(grid, ALGORITHMS[name], repeat, track_memory) for name in algorithms
+    }
+    if write_png is not None:
+        filename = os.path.join(directory, "benchmark.png")
+        record("render png", lambda: write_png(filename, grid, 1))
+        os.remove(filename)
+    return {
+        "factory": factory_name,
+        "size": size,
+        "seed": seed,
+        "grid": [grid.width, grid.length],
+        "steps": steps,
+        "algorithms": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument(
+        "--factories", nargs="+", choices=list(FACTORIES), default=list(FACTORIES)
+    )
+    parser.add_argument(
+        "--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS)
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--memory", action="store_true")
+    parser.add_argument("--output", help="JSON file, printed if not given")
+    args = parser.parse_args()
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "repeat": args.repeat,
+        "memory": args.memory,
+        "results": [],
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            for factory_name in args.factories:
+                print(f"{factory_name} {size}x{size}", file=sys.stderr)
+                report["results"].append(
+                    benchmark_maze(
+                        factory_name,
+                        size,
+                        args.seed,
+                        args.algorithms,
+                        directory,
+                        args.repeat,
+                        args.memory,
+                    )
+                )
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
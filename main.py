@@ -1,5 +1,9 @@
-from maze.maze import Maze
-from maze.algorithm import DFSAlgorithm, BFSAlgorithm, MazeSolver
+from maze.maze import Maze, configure_logging
+from maze.algorithm import (
+    DFSAlgorithm,
+    BFSAlgorithm,
+    MazeSolver,
+)
 from maze.maze_factory import DFSMaze
 
 
@@ -47,6 +51,9 @@ def plot_full_algorithm_path(
 
 
 def main():
+    ## write the log of the solvers to sample.log, DFSAlgorithm logs every step
+    configure_logging()
+
     ## 1) Create Mazes
     ## 1a) read_maze via files
     maze = read_maze()
@@ -55,10 +62,12 @@ def main():
     # maze = create_maze(width=8, length=15)
 
     ## 2) Solve Maze
-    # Select algorithm (DFSAlgorithm or BFSAlgorithm)
+    # Select algorithm (DFSAlgorithm, BFSAlgorithm, AStarAlgorithm,
+    # GreedyBestFirstAlgorithm or BidirectionalBFSAlgorithm from maze.algorithm)
 
     maze_solver = MazeSolver(maze=maze, algorithm=BFSAlgorithm)
     # maze_solver = MazeSolver(maze=maze, algorithm=DFSAlgorithm)
+    # maze_solver = MazeSolver(maze=maze, algorithm=AStarAlgorithm)
     maze_solver.solve_maze()
 
     ## 3) Plot Maze
@@ -71,6 +80,8 @@ def main():
     ## 4) Export Maze
     ## 0-Walls / 1-Cells / 2-Start / 3-End
     # maze.export_maze("maze_examples/maze_6_3.txt")
+    ## binary format with 2 bits per cell, read back via Maze.import_maze
+    # maze.export_maze("maze_examples/maze_6_3.maze")
 
 
 if __name__ == "__main__":
@@ -1,20 +1,23 @@
 from typing import Tuple, Dict, List
-from maze.maze import Maze, logger, LOG_FILE
-from matplotlib import pyplot as plt
-from matplotlib import colors as c
+import logging
+from array import array
+import random
+from maze.maze import Maze, logger
+from maze.stats import SolveStats, phase
 from abc import ABC, abstractmethod
 from maze.maze_utils import (
     subtract_tuples,
-    transform_coordinates,
-    remove_coords_from_maze_path,
-    select_direction,
-    opposite_direction,
-    compute_lower_number,
-    compute_upper_number,
-    construct_bfs_path,
+    compute_key_offsets,
+    transform_indices,
+)
+from maze.search import (
+    UNVISITED,
+    breadth_first_search,
+    best_first_search,
+    bidirectional_search,
+    reconstruct_path,
+    branch_paths,
 )
-
-import re
 
 
 class NotSolvable(Exception):
@@ -23,8 +26,9 @@ class NotSolvable(Exception):
 
 class MazeAlgorithm(ABC):
     @abstractmethod
-    def solve(maze: Maze):
-        """setting _solution_path and _full_path of the maze"""
+    def solve(maze: Maze, stats: SolveStats = None):
+        """returns the solution path and the full path of the maze, stats (if
+        given) collects the phases and counters of the search"""
 
     @abstractmethod
     def view_path(
@@ -36,17 +40,36 @@ class MazeAlgorithm(ABC):
 
 
 class MazeSolver:
-    def __init__(self, maze: Maze, algorithm: MazeAlgorithm):
+    direction_dict = {
+        "right": "^",
+        "left": "v",
+        "up": "<",
+        "down": ">",
+        "stuck": "o",
+    }
+
+    def __init__(self, maze: Maze, algorithm: MazeAlgorithm, stats: SolveStats = None):
         self.maze = maze
         self.algorithm = algorithm
+        # defaults to the stats the maze was loaded with, None measures nothing
+        self.stats = stats if stats is not None else maze.stats
         self._full_path = []
         self._solution_path = []
         self.path_dict = {"full": "_full_path", "solution": "_solution_path"}
 
     def solve_maze(self):
-        solution_path, full_path = self.algorithm.solve(self.maze)
+        if self.stats is None:
+            solution_path, full_path = self.algorithm.solve(self.maze)
+        else:
+            solution_path, full_path = self.algorithm.solve(self.maze, self.stats)
         self._solution_path = solution_path
         self._full_path = full_path
+        logger.debug(
+            "%s visited %s points, solution path has %s points",
+            self.algorithm.__name__,
+            len(full_path),
+            len(solution_path),
+        )
 
     @property
     def full_path(self):
@@ -57,12 +80,19 @@ class MazeSolver:
         return self._solution_path
 
     def view_path(
-        self, choice: str = "solution", pausing: float = 0.05, marker_size: int = 50
+        self,
+        choice: str = "solution",
+        pausing: float = 0.05,
+        marker_size: int = 50,
+        fps: int = 30,
     ) -> None:
-        if choice in self.path_dict:
-            path = self.__dict__[self.path_dict[choice]]
-        else:
-            raise ValueError("Invalid Input")
+        """Animates the path with pausing seconds per point. Points are drawn in
+        batches so the animation runs at no more than fps frames per second."""
+        # matplotlib takes long to import, only load it when plotting
+        from matplotlib import pyplot as plt
+        from matplotlib import colors as c
+
+        plot_dict = self.plot_dict(choice)
         fig, ax = plt.subplots()
         cmap = c.ListedColormap(["indigo", "darkcyan", "yellow", "lime"])
         ax.pcolormesh([item for item in reversed(self.maze.config)], cmap=cmap)
@@ -74,115 +104,151 @@ class MazeSolver:
         ax.set_xticklabels([])
         # plt.axis("off")
         plt.pause(2.0)
-        direction_dict = {
-            "right": "^",
-            "left": "v",
-            "up": "<",
-            "down": ">",
-            "stuck": "o",
-        }
-        plot_dict = self.algorithm.view_path(self.maze.directions, path, choice)
-        for coords, direction in plot_dict.items():
-            x, y = coords
-            # transform coordinates e.g. (5,10) corresponds to (9.5,2.5) on plot
-            u, v = (x - 0.5, y - 0.5)
-            ax.scatter(
-                x=u,
-                y=v,
-                marker=direction_dict[direction],
-                s=marker_size,
-                c="lightcoral",
-            )
-            plt.pause(pausing)
+        # the animation has to be referenced until the figure is closed
+        animation = self.path_animation(ax, plot_dict, pausing, marker_size, fps)
         plt.show()
+        del animation
+
+    def plot_dict(self, choice: str = "solution") -> Dict[Tuple[int, int], str]:
+        if choice in self.path_dict:
+            path = self.__dict__[self.path_dict[choice]]
+        else:
+            raise ValueError("Invalid Input")
+        return self.algorithm.view_path(self.maze.directions, path, choice)
+
+    def path_animation(
+        self,
+        ax,
+        plot_dict: Dict[Tuple[int, int], str],
+        pausing: float = 0.05,
+        marker_size: int = 50,
+        fps: int = 30,
+    ):
+        """All points are one scatter artist whose offsets and markers grow
+        frame by frame, only this artist is redrawn (blitting)"""
+        from matplotlib.animation import FuncAnimation
+
+        offsets, paths = path_markers(plot_dict, self.direction_dict)
+        collection = ax.scatter([], [], s=marker_size, c="lightcoral", animated=True)
+
+        def update(end: int):
+            collection.set_offsets(offsets[:end])
+            collection.set_paths(paths[:end])
+            return (collection,)
+
+        return FuncAnimation(
+            ax.figure,
+            update,
+            frames=frame_ends(len(paths), pausing, fps),
+            interval=frame_interval(len(paths), pausing, fps),
+            blit=True,
+            repeat=False,
+        )
+
+
+def path_markers(
+    plot_dict: Dict[Tuple[int, int], str], direction_dict: Dict[str, str]
+) -> Tuple[list, list]:
+    """Plot positions and marker paths of the points of plot_dict, markers are
+    shared between all points of the same direction"""
+    from matplotlib.markers import MarkerStyle
+
+    marker_paths = {}
+    for direction, marker in direction_dict.items():
+        style = MarkerStyle(marker)
+        marker_paths[direction] = style.get_path().transformed(style.get_transform())
+    # transform coordinates e.g. (5,10) corresponds to (9.5,2.5) on plot
+    offsets = [(x - 0.5, y - 0.5) for x, y in plot_dict]
+    paths = [marker_paths[direction] for direction in plot_dict.values()]
+    return offsets, paths
+
+
+def frame_step(count: int, pausing: float, fps: int) -> int:
+    """Points added per frame: one, unless a point every pausing seconds would
+    exceed fps frames per second"""
+    if pausing <= 0:
+        return max(1, count)
+    return max(1, round(1 / (pausing * fps)))
+
+
+def frame_ends(count: int, pausing: float, fps: int) -> range:
+    """Number of points shown in every frame"""
+    step = frame_step(count, pausing, fps)
+    return range(step, count + step, step)
+
+
+def frame_interval(count: int, pausing: float, fps: int) -> float:
+    """Milliseconds between frames, so that every point takes pausing seconds
+    but frames never come faster than fps per second"""
+    return max(1000 / fps, 1000 * pausing * frame_step(count, pausing, fps))
 
 
 class DFSAlgorithm(MazeAlgorithm):
-    def solve(maze: Maze):
-        return (DFSAlgorithm.get_solution_path(maze), DFSAlgorithm.get_full_path(maze))
-
-    def get_solution_path(maze: Maze):
-        with open(LOG_FILE, "w"):
-            pass
-        start = maze.starting_point
-        end = maze.ending_point
-        maze_path = {}
-        turning_points = []
-        index = 0
-        current_point = start
-        while current_point != end:
-            if index in maze_path:
-                current_neighbours = maze_path[index][1]
-            else:
-                current_neighbours = dict(maze.cell_config[current_point]._neighbours)
-
-            remove_coords_from_maze_path(maze_path, current_neighbours)
-
-            if len(current_neighbours) == 0:
-                logger.debug(f"Current Point {current_point} has no neighbours!")
-                index -= 1
-                while index > turning_points[-1]:
-                    del maze_path[index]
-                    index -= 1
-                # index -= 1
-                next_point = maze_path[index][0]
-                index -= 1
-
-            elif len(current_neighbours) == 1:
-                if index in turning_points:
-                    turning_points.remove(index)
-                # key = random.choice(list(current_neighbours.keys()))
-                key = select_direction(end, current_neighbours)
-                # check if neighbour is end_point
-                next_point = current_neighbours[key]
-                logger.debug(
-                    f"Current Point {current_point} has 1 neighbour! Next Point {next_point}"
-                )
-                del current_neighbours[key]
-                maze_path[index] = [
-                    current_point,
-                    current_neighbours,
-                ]
+    def solve(maze: Maze, stats: SolveStats = None):
+        full_path = array("l")
+        with phase(stats, "solve"):
+            solution_path = DFSAlgorithm.get_solution_path(maze, full_path)
+        with phase(stats, "path reconstruction"):
+            full_path_points = DFSAlgorithm.get_full_path(maze, full_path)
+        if stats is not None:
+            stats.record_walk(full_path)
+        return (solution_path, full_path_points)
+
+    def get_solution_path(maze: Maze, full_path: array = None):
+        """Searches the end point and appends the grid index of every visited
+        point to full_path (backtracking jumps straight to the turning point)"""
+        if full_path is None:
+            full_path = array("l")
+        grid = maze.grid
+        neighbours = grid.neighbours
+        start = grid.index(*maze.starting_point)
+        end = grid.index(*maze.ending_point)
+        visited = bytearray(grid.size)
+        visited[start] = 1
+        stack = [start]
+        full_path.append(start)
+        # every step is logged once configure_logging is called
+        log_steps = logger.isEnabledFor(logging.DEBUG)
+        while stack[-1] != end:
+            current_point = stack[-1]
+            current_neighbours = [
+                index for index in neighbours(current_point) if not visited[index]
+            ]
+            if not current_neighbours:
+                if log_steps:
+                    logger.debug(
+                        "Current Point %s has no neighbours!",
+                        grid.coords(current_point),
+                    )
+                stack.pop()
+                if not stack:
+                    raise NotSolvable("Maze is not solvable!")
+                continue
+
+            if end in current_neighbours:
+                next_point = end
             else:
-                if index not in turning_points:
-                    turning_points.append(index)
-                # key = random.choice(list(current_neighbours.keys()))
-                key = select_direction(end, current_neighbours)
-                # check if neighbour is end_point
-                next_point = current_neighbours[key]
+                next_point = random.choice(current_neighbours)
+            if log_steps:
                 logger.debug(
-                    f"Current Point {current_point} has at least 2 neighbours! Next Point {next_point}"
+                    "Current Point %s has %s neighbour(s)! Next Point %s",
+                    grid.coords(current_point),
+                    len(current_neighbours),
+                    grid.coords(next_point),
                 )
-                del current_neighbours[key]
-                maze_path[index] = [
-                    current_point,
-                    current_neighbours,
-                ]
-            current_point = next_point
-            index += 1
-
-        path = [values[0] for values in maze_path.values()]
-        path.append(end)
-        return transform_coordinates(path, maze.width)
-
-    def get_full_path(maze: Maze):
-        path_list = []
-        with open(LOG_FILE) as file:
-            pattern = re.compile("\((\d+), (\d+)\)")
-            for line in file.readlines():
-                matches = pattern.finditer(line)
-                for match in matches:
-                    path_list.append((int(match.group(1)), int(match.group(2))))
-        if not path_list:
-            raise ValueError(
-                "The sample.log file is empty. You first need to solve a maze!"
-            )
-        final_list = []
-        for index in range(len(path_list) - 1):
-            if path_list[index + 1] != path_list[index]:
-                final_list.append(path_list[index])
-        final_list.append(path_list[-1])
-        return transform_coordinates(final_list, maze.width)
+            if full_path[-1] != current_point:
+                full_path.append(current_point)
+            full_path.append(next_point)
+            visited[next_point] = 1
+            stack.append(next_point)
+
+        return transform_indices(stack, grid)
+
+    def get_full_path(maze: Maze, full_path: array):
+        """Converts the grid indices recorded by get_solution_path"""
+        if not full_path:
+            raise ValueError("The full path is empty. You first need to solve a maze!")
+        return transform_indices(full_path, maze.grid)
 
     def view_path(
         maze_directions: Dict[str, Tuple[int, int]],
@@ -204,65 +270,26 @@ class DFSAlgorithm(MazeAlgorithm):
 
 
 class BFSAlgorithm(MazeAlgorithm):
-    def solve(maze: Maze):
-        with open(LOG_FILE, "w"):
-            pass
-        start = maze.starting_point
-        end = maze.ending_point
-        search_loop = True
-        dict_path: dict = {"1": [start]}
-        dict_active: dict = {"1": start}
-        current_point = start
-        while search_loop:
-            for key_index in dict_active.copy().keys():
-                current_point = dict_active[key_index]
-                current_neighbours = dict(maze.cell_config[current_point]._neighbours)
-                # remove_coords_from_maze_path(maze_path, current_neighbours)
-
-                if len(current_neighbours) == 0:
-                    del dict_active[key_index]
-                    if not dict_active:
-                        raise NotSolvable("Maze is not solvable!")
-
-                elif len(current_neighbours) == 1:
-                    direction = select_direction(end, current_neighbours)
-                    next_point = current_neighbours[direction]
-                    logger.debug(
-                        f"Current Point {current_point} has 1 neighbour! Next Point {next_point}"
-                    )
-                    dict_path[key_index].append(next_point)
-                    if next_point == end:
-                        search_loop = False
-                        break
-                    dict_active[key_index] = next_point
-                    del maze.cell_config[next_point]._neighbours[
-                        opposite_direction(direction)
-                    ]
-
-                else:
-                    logger.debug(
-                        f"Current Point {current_point} has at least 2 neighbours! Path will be split"
-                    )
-                    for index, direction in enumerate(current_neighbours.copy().keys()):
-                        next_point = current_neighbours[direction]
-                        if next_point == end:
-                            search_loop = False
-                            dict_path[key_index].append(next_point)
-                            break
-
-                        del maze.cell_config[next_point]._neighbours[
-                            opposite_direction(direction)
-                        ]
-                        dict_active[key_index + "." + str(index + 1)] = next_point
-                        dict_path[key_index + "." + str(index + 1)] = [next_point]
-                    del dict_active[key_index]
-
-        path = construct_bfs_path(key_index, dict_path)
-        dict_path = {
-            key: transform_coordinates(value, maze.width)
-            for key, value in dict_path.items()
-        }
-        return (transform_coordinates(path, maze.width), dict_path)
+    def solve(maze: Maze, stats: SolveStats = None):
+        """Visited points are tracked by the solve itself, the maze is left
+        untouched and can be solved again or shared between threads"""
+        grid = maze.grid
+        start = grid.index(*maze.starting_point)
+        end = grid.index(*maze.ending_point)
+        with phase(stats, "solve"):
+            parents, order = breadth_first_search(grid, start, end)
+        if stats is not None:
+            stats.record_search(parents, order)
+        if parents[end] == UNVISITED:
+            raise NotSolvable("Maze is not solvable!")
+        with phase(stats, "path reconstruction"):
+            path = reconstruct_path(parents, end)
+            dict_path = {
+                key: transform_indices(value, grid)
+                for key, value in branch_paths(parents, order, end).items()
+            }
+            solution_path = transform_indices(path, grid)
+        return (solution_path, dict_path)
 
     def view_path(
         maze_directions: Dict[str, Tuple[int, int]],
@@ -294,33 +321,169 @@ class BFSAlgorithm(MazeAlgorithm):
 
     def view_full_path(
         maze_directions: Dict[str, Tuple[int, int]],
-        path: List[Tuple[int, int]],
+        path: Dict[str, List[Tuple[int, int]]],
     ):
+        """Orders the points of all branches by their distance to the start.
+        A branch starts where its parent branch ends, so every point is put
+        into its frame once and the frames are read in order."""
         path_dict = {value: move for move, value in maze_directions.items()}
-        key_indices = list(path.keys())
-        key_numbers = {key: len(path[key]) for key in key_indices}
-        total_lower_key_numbers = {
-            key: compute_lower_number(key, key_numbers) for key in key_numbers
-        }
-        total_upper_key_numbers = {
-            key: compute_upper_number(key, key_numbers) for key in key_numbers
-        }
-        min_value = 0
-        max_value = max(list(total_upper_key_numbers.values()))
+        key_numbers = {key: len(points) for key, points in path.items()}
+        key_offsets = compute_key_offsets(key_numbers)
+        max_value = max(key_offsets[key] + key_numbers[key] for key in key_numbers)
+        frames = [[] for _ in range(max_value)]
+        for key, points in path.items():
+            offset = key_offsets[key]
+            last = len(points) - 1
+            for index, coords in enumerate(points):
+                if index == last:
+                    sign = "stuck"
+                else:
+                    sign = path_dict[subtract_tuples(points[index + 1], coords)]
+                frames[offset + index].append((coords, sign))
         final_path = {}
-        for index in range(min_value, max_value):
-            for key in key_numbers:
-                key_min_val, key_max_val = (
-                    total_lower_key_numbers[key],
-                    total_upper_key_numbers[key],
-                )
-                if key_min_val <= index and key_max_val > index:
-                    coords = path[key][index - key_min_val]
-                    if index + 1 == key_max_val:
-                        sign = "stuck"
-                    else:
-                        sign = path_dict[
-                            subtract_tuples(path[key][index - key_min_val + 1], coords)
-                        ]
-                    final_path[coords] = sign
+        for frame in frames:
+            for coords, sign in frame:
+                final_path[coords] = sign
         return final_path
+
+
+class BestFirstAlgorithm(MazeAlgorithm):
+    """Common part of the heuristic searches, the full path holds the points
+    in the order they were expanded"""
+
+    def search(maze: Maze, cost_weight: int, stats: SolveStats = None):
+        grid = maze.grid
+        start = grid.index(*maze.starting_point)
+        end = grid.index(*maze.ending_point)
+        with phase(stats, "solve"):
+            parents, order = best_first_search(grid, start, end, cost_weight)
+        if stats is not None:
+            stats.record_search(parents, order)
+        if parents[end] == UNVISITED:
+            raise NotSolvable("Maze is not solvable!")
+        with phase(stats, "path reconstruction"):
+            path = reconstruct_path(parents, end)
+            return (transform_indices(path, grid), transform_indices(order, grid))
+
+    def view_path(
+        maze_directions: Dict[str, Tuple[int, int]],
+        path: List[Tuple[int, int]],
+        choice: str = "",
+    ):
+        path_dict = {value: move for move, value in maze_directions.items()}
+        plot_dict = {}
+        for tup, next_tup in zip(path, path[1:]):
+            # consecutively expanded points do not need to be adjacent
+            plot_dict[tup] = path_dict.get(subtract_tuples(next_tup, tup), "stuck")
+        plot_dict[path[-1]] = "stuck"
+        return plot_dict
+
+
+class AStarAlgorithm(BestFirstAlgorithm):
+    def solve(maze: Maze, stats: SolveStats = None):
+        return BestFirstAlgorithm.search(maze, cost_weight=1, stats=stats)
+
+
+class GreedyBestFirstAlgorithm(BestFirstAlgorithm):
+    def solve(maze: Maze, stats: SolveStats = None):
+        return BestFirstAlgorithm.search(maze, cost_weight=0, stats=stats)
+
+
+class BidirectionalBFSAlgorithm(MazeAlgorithm):
+    """Breadth first search from start and end at the same time, the full path
+    holds the points of both searches in the order they were visited"""
+
+    def solve(maze: Maze, stats: SolveStats = None):
+        grid = maze.grid
+        start = grid.index(*maze.starting_point)
+        end = grid.index(*maze.ending_point)
+        with phase(stats, "solve"):
+            forward, backward, meeting, order = bidirectional_search(grid, start, end)
+        if stats is not None:
+            # both searches count on their own, the peak frontier is the larger one
+            for parents in (forward, backward):
+                stats.record_search(
+                    parents, [index for index in order if parents[index] != UNVISITED]
+                )
+        if meeting == UNVISITED:
+            raise NotSolvable("Maze is not solvable!")
+        with phase(stats, "path reconstruction"):
+            path = reconstruct_path(forward, meeting)
+            path += reversed(reconstruct_path(backward, meeting)[:-1])
+            return (transform_indices(path, grid), transform_indices(order, grid))
+
+    def view_path(
+        maze_directions: Dict[str, Tuple[int, int]],
+        path: List[Tuple[int, int]],
+        choice: str = "",
+    ):
+        return BestFirstAlgorithm.view_path(maze_directions, path, choice)
+
+
+class JunctionGraphAlgorithm(MazeAlgorithm):
+    """Dijkstra on the junction graph of the maze, corridors are crossed in one
+    step. The full path holds the corridors in the order they were settled."""
+
+    def solve(maze: Maze, stats: SolveStats = None):
+        grid = maze.grid
+        with phase(stats, "index build"):
+            graph = maze.junction_graph()
+        start = grid.index(*maze.starting_point)
+        end = grid.index(*maze.ending_point)
+        with phase(stats, "solve"):
+            parents, order = graph.search(start, end)
+        if stats is not None:
+            # counts the nodes of the graph, not the cells of the corridors
+            stats.record_search(
+                {node: previous for node, (previous, _) in parents.items()}, order
+            )
+        if end not in parents:
+            raise NotSolvable("Maze is not solvable!")
+        with phase(stats, "path reconstruction"):
+            full_path = [start]
+            for node in order[1:]:
+                previous, edge_id = parents[node]
+                full_path += graph.edge_cells(edge_id, previous)
+                full_path.append(node)
+            path = graph.expand(parents, end)
+            return (
+                transform_indices(path, grid),
+                transform_indices(full_path, grid),
+            )
+
+    def view_path(
+        maze_directions: Dict[str, Tuple[int, int]],
+        path: List[Tuple[int, int]],
+        choice: str = "",
+    ):
+        return BestFirstAlgorithm.view_path(maze_directions, path, choice)
+
+
+class LifelongAStarAlgorithm(MazeAlgorithm):
+    """Lifelong Planning A* kept by the maze, so solving again after set_cell
+    only repairs the part of the search affected by the changed cells. The full
+    path holds the points expanded by the last repair, solving again without
+    changes repeats it."""
+
+    def solve(maze: Maze, stats: SolveStats = None):
+        grid = maze.grid
+        planner = maze.planner()
+        with phase(stats, "solve"):
+            order = planner.compute_shortest_path()
+        if stats is not None:
+            stats.cells_expanded = (stats.cells_expanded or 0) + len(order)
+        with phase(stats, "path reconstruction"):
+            path = planner.path()
+            if not path:
+                raise NotSolvable("Maze is not solvable!")
+            return (
+                transform_indices(path, grid),
+                transform_indices(planner.last_expanded, grid),
+            )
+
+    def view_path(
+        maze_directions: Dict[str, Tuple[int, int]],
+        path: List[Tuple[int, int]],
+        choice: str = "",
+    ):
+        return BestFirstAlgorithm.view_path(maze_directions, path, choice)
@@ -0,0 +1,142 @@
+import logging
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Type, Union
+from maze.maze import Maze
+from maze.grid import Grid
+from maze.algorithm import MazeAlgorithm, BFSAlgorithm
+from maze.maze_factory import MazeFactory
+from maze.maze_utils import retransform_coordinates
+
+# loggers which configure_logging() attaches file handlers to
+FILE_LOGGERS = ("maze.maze", "maze.maze_factory")
+
+
+class SolveResult(NamedTuple):
+    # file name of the maze or its position in the batch
+    source: Union[str, int]
+    # grid indices of the solution path, None if solving failed
+    solution_path: Optional[array]
+    # number of points the algorithm visited
+    visited: int
+    error: Optional[Exception]
+
+    @property
+    def solved(self) -> bool:
+        return self.error is None
+
+
+def init_worker() -> None:
+    """Worker processes share the working directory, keep them off the log files"""
+    for name in FILE_LOGGERS:
+        logger = logging.getLogger(name)
+        for handler in list(logger.handlers):
+            if isinstance(handler, logging.FileHandler):
+                logger.removeHandler(handler)
+
+
+def maze_payload(index: int, maze: Union[str, os.PathLike, Maze]):
+    """What is sent to a worker: the file name or the bare grid of a maze"""
+    if isinstance(maze, Maze):
+        grid = maze.grid
+        return (index, (grid.width, grid.length, bytes(grid.values)))
+    return (os.fspath(maze), os.fspath(maze))
+
+
+def solve_item(item, algorithm: MazeAlgorithm = BFSAlgorithm) -> SolveResult:
+    source, payload = item
+    try:
+        if isinstance(payload, str):
+            maze = Maze.import_maze(payload)
+        else:
+            width, length, values = payload
+            maze = Maze.from_grid(Grid(width, length, bytearray(values)))
+        solution_path, full_path = algorithm.solve(maze)
+    # a broken maze must not abort the rest of the batch
+    except Exception as error:
+        return SolveResult(source, None, 0, error)
+    grid = maze.grid
+    indices = array(
+        "l",
+        (
+            grid.index(x, y)
+            for x, y in retransform_coordinates(solution_path, grid.width)
+        ),
+    )
+    if isinstance(full_path, dict):
+        visited = sum(len(path) for path in full_path.values())
+    else:
+        visited = len(full_path)
+    return SolveResult(source, indices, visited, None)
+
+
+def solve_many(
+    mazes: Iterable[Union[str, os.PathLike, Maze]],
+    algorithm: MazeAlgorithm = BFSAlgorithm,
+    workers: int = None,
+    chunksize: int = None,
+) -> List[SolveResult]:
+    """Solves maze files or Maze objects on a pool of worker processes.
+
+    Results keep the order of mazes. Failures (e.g. NotSolvable or an invalid
+    file) are reported in the result of their maze. With workers=1 everything
+    is solved in the calling process."""
+    items = [maze_payload(index, maze) for index, maze in enumerate(mazes)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    solve = partial(solve_item, algorithm=algorithm)
+    if workers <= 1 or len(items) <= 1:
+        return [solve(item) for item in items]
+    if chunksize is None:
+        chunksize = max(1, len(items) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+        return list(pool.map(solve, items, chunksize=chunksize))
+
+
+def generate_item(item) -> str:
+    factory_cls, width, length, seed, filename = item
+    maze_generator = factory_cls(width, length, seed)
+    maze_generator.create_maze()
+    maze_generator.export_maze(filename)
+    return filename
+
+
+def generate_many(
+    factory_cls: Type[MazeFactory],
+    sizes: Iterable[Tuple[int, int]],
+    seeds: Iterable[int],
+    directory: str = "maze_examples",
+    workers: int = None,
+    ending: str = "maze",
+) -> List[str]:
+    """Generates one maze per (width, length) in sizes with the seed at the same
+    position in seeds on a pool of worker processes. Every maze is written to
+    directory (packed binary format by default), the file names are returned.
+    Repeated (size, seed) pairs are generated once and share their file."""
+    sizes, seeds = list(sizes), list(seeds)
+    if len(sizes) != len(seeds):
+        raise ValueError(f"Got {len(sizes)} sizes but {len(seeds)} seeds!")
+    prefix = os.path.join(directory, factory_cls.__name__.lower())
+    filenames = [
+        f"{prefix}_{width}_{length}_{seed}.{ending}"
+        for (width, length), seed in zip(sizes, seeds)
+    ]
+    # two workers must never write the same file at once
+    items = list(
+        {
+            filename: (factory_cls, width, length, seed, filename)
+            for filename, (width, length), seed in zip(filenames, sizes, seeds)
+        }.values()
+    )
+    os.makedirs(directory, exist_ok=True)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(items) <= 1:
+        for item in items:
+            generate_item(item)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            list(pool.map(generate_item, items))
+    return filenames
@@ -0,0 +1,2 @@
+class InvalidList(Exception):
+    pass
@@ -0,0 +1,185 @@
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Tuple
+from cell.cell import Cell
+
+# open-direction bits of a cell, in the same order as Maze.directions
+UP, DOWN, RIGHT, LEFT = 1, 2, 4, 8
+DIRECTION_BITS = {"up": UP, "down": DOWN, "right": RIGHT, "left": LEFT}
+
+# maps walls to 0 and every other cell value to 1
+OPEN_TABLE = bytes([0] + [1] * 255)
+
+
+class Grid:
+    """Flat row-major storage of a maze: one byte per cell for its value
+    (0-Walls / 1-Cells / 2-Start / 3-End) and one byte for its 4-bit mask of
+    open directions. Coordinates are 1-based (row, column) tuples like in Maze,
+    indices are positions in the flat arrays."""
+
+    def __init__(self, width: int, length: int, values: bytearray = None):
+        self._width = width
+        self._length = length
+        if values is None:
+            values = bytearray(width * length)
+        if len(values) != width * length:
+            raise ValueError(
+                f"Grid of size {width}x{length} cannot hold {len(values)} values!"
+            )
+        self.values = values
+        self.masks = bytearray(width * length)
+        deltas = {"up": -length, "down": length, "right": 1, "left": -1}
+        self._offsets = [
+            tuple(
+                (direction, deltas[direction])
+                for direction, bit in DIRECTION_BITS.items()
+                if mask & bit
+            )
+            for mask in range(16)
+        ]
+        # index offsets of the open neighbours of every mask, for hot loops
+        self.deltas = [
+            tuple(delta for _, delta in offsets) for offsets in self._offsets
+        ]
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    @property
+    def size(self) -> int:
+        return len(self.values)
+
+    def index(self, x: int, y: int) -> int:
+        return (x - 1) * self._length + (y - 1)
+
+    def coords(self, index: int) -> Tuple[int, int]:
+        x, y = divmod(index, self._length)
+        return (x + 1, y + 1)
+
+    def contains(self, x: int, y: int) -> bool:
+        return 0 < x <= self._width and 0 < y <= self._length
+
+    def init_masks(self) -> None:
+        """Computes the open-direction mask of every cell in one sweep.
+
+        The grid is read as a single integer holding one byte per cell (1 if the
+        cell is open), so shifting it by a row or a column and and-ing it with
+        itself yields the open neighbours of all cells at once."""
+        size = len(self.values)
+        if not size:
+            return
+        open_cells = int.from_bytes(self.values.translate(OPEN_TABLE), "little")
+        # 1 for every cell which is not in the last column
+        inner = int.from_bytes(
+            (b"\x01" * (self._length - 1) + b"\x00") * self._width, "little"
+        )
+        row_shift = 8 * self._length
+        up = open_cells & (open_cells << row_shift)
+        down = open_cells & (open_cells >> row_shift)
+        right = open_cells & (open_cells >> 8) & inner
+        left = open_cells & ((open_cells & inner) << 8)
+        masks = up | (down << 1) | (right << 2) | (left << 3)
+        self.masks = bytearray(masks.to_bytes(size, "little"))
+
+    def cell_mask(self, index: int) -> int:
+        """Open-direction mask of a single cell, see init_masks"""
+        values = self.values
+        if not values[index]:
+            return 0
+        x, y = divmod(index, self._length)
+        mask = 0
+        if x and values[index - self._length]:
+            mask |= UP
+        if x < self._width - 1 and values[index + self._length]:
+            mask |= DOWN
+        if y < self._length - 1 and values[index + 1]:
+            mask |= RIGHT
+        if y and values[index - 1]:
+            mask |= LEFT
+        return mask
+
+    def adjacent(self, index: int) -> List[int]:
+        """Indices of the cells next to index, open or not"""
+        x, y = divmod(index, self._length)
+        cells = []
+        if x:
+            cells.append(index - self._length)
+        if x < self._width - 1:
+            cells.append(index + self._length)
+        if y < self._length - 1:
+            cells.append(index + 1)
+        if y:
+            cells.append(index - 1)
+        return cells
+
+    def set_value(self, index: int, value: int) -> None:
+        """Changes the value of one cell and recomputes only the masks of the cell
+        and the cells next to it"""
+        self.values[index] = value
+        for cell in [index] + self.adjacent(index):
+            self.masks[cell] = self.cell_mask(cell)
+
+    def neighbours(self, index: int) -> List[int]:
+        """Indices of the open neighbours of the cell at index"""
+        return [index + delta for _, delta in self._offsets[self.masks[index]]]
+
+    def neighbour_directions(self, index: int) -> List[Tuple[str, int]]:
+        """(direction, index) pairs of the open neighbours of the cell at index"""
+        return [
+            (direction, index + delta)
+            for direction, delta in self._offsets[self.masks[index]]
+        ]
+
+    def neighbour_dict(self, x: int, y: int) -> Dict[str, Tuple[int, int]]:
+        """Open neighbours of a cell in the shape of Cell._neighbours"""
+        return {
+            direction: self.coords(index)
+            for direction, index in self.neighbour_directions(self.index(x, y))
+        }
+
+
+class CellConfig(Mapping):
+    """Read-only view of a Grid as {(x, y): Cell}. Cells are only created on
+    first access and are kept afterwards, so changes to their _neighbours
+    persist like they did for the former dict of cells."""
+
+    def __init__(self, grid: Grid, valid_values: Dict[int, str]):
+        self._grid = grid
+        self._valid_values = valid_values
+        self._cells = {}
+
+    def __getitem__(self, coords: Tuple[int, int]) -> Cell:
+        if coords in self._cells:
+            return self._cells[coords]
+        try:
+            x, y = coords
+            if not self._grid.contains(x, y):
+                raise KeyError(coords)
+        except (TypeError, ValueError):
+            raise KeyError(coords)
+        typing = self._valid_values[self._grid.values[self._grid.index(x, y)]]
+        cell = Cell(x, y, typing)
+        if typing != "W":
+            cell._neighbours = self._grid.neighbour_dict(x, y)
+        self._cells[coords] = cell
+        return cell
+
+    def __contains__(self, coords) -> bool:
+        try:
+            x, y = coords
+            return self._grid.contains(x, y)
+        except (TypeError, ValueError):
+            return False
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        # same column-major order in which Maze used to build its cells
+        for i in range(self._grid.length):
+            for j in range(self._grid.width):
+                yield (j + 1, i + 1)
+
+    def __len__(self) -> int:
+        return self._grid.size
@@ -0,0 +1,118 @@
+from array import array
+from heapq import heappush, heappop
+from itertools import count
+from typing import Dict, List, Tuple
+from maze.grid import Grid
+
+INFINITY = 2**31 - 1
+
+
+class LifelongAStar:
+    """Lifelong Planning A* from source to target on the open cells of a grid.
+
+    Every cell keeps its distance estimate g and the one step lookahead rhs
+    between searches. When single cells change (see update_cell) only the
+    cells whose distance to source actually changed become inconsistent and
+    are expanded again, instead of searching the whole grid from scratch."""
+
+    def __init__(self, grid: Grid, source: int, target: int):
+        self._grid = grid
+        self.source = source
+        self.target = target
+        self._target_row, self._target_column = divmod(target, grid.length)
+        self.g = array("l", [INFINITY]) * grid.size
+        self.rhs = array("l", [INFINITY]) * grid.size
+        self.rhs[source] = 0
+        # latest key of every inconsistent cell, older heap entries are skipped
+        self._queued: Dict[int, Tuple[int, int]] = {}
+        self._heap = []
+        self._tie = count()
+        # cells expanded by the last call of compute_shortest_path that did work
+        self.last_expanded: List[int] = []
+        self.push(source)
+
+    def heuristic(self, index: int) -> int:
+        row, column = divmod(index, self._grid.length)
+        return abs(row - self._target_row) + abs(column - self._target_column)
+
+    def key(self, index: int) -> Tuple[int, int]:
+        distance = min(self.g[index], self.rhs[index])
+        return (distance + self.heuristic(index), distance)
+
+    def push(self, index: int) -> None:
+        key = self.key(index)
+        self._queued[index] = key
+        heappush(self._heap, (key[0], key[1], next(self._tie), index))
+
+    def top_key(self) -> Tuple[int, int]:
+        heap = self._heap
+        while heap:
+            first, second, _, index = heap[0]
+            if self._queued.get(index) == (first, second):
+                return (first, second)
+            heappop(heap)
+        return (INFINITY, INFINITY)
+
+    def update_vertex(self, index: int) -> None:
+        g = self.g
+        if index != self.source:
+            best = INFINITY
+            for neighbour in self._grid.neighbours(index):
+                if g[neighbour] + 1 < best:
+                    best = g[neighbour] + 1
+            self.rhs[index] = best
+        if g[index] != self.rhs[index]:
+            self.push(index)
+        else:
+            self._queued.pop(index, None)
+
+    def update_cell(self, index: int) -> None:
+        """Repairs the lookahead values after the cell at index was opened or
+        closed, the masks of the grid have to be updated already"""
+        self.update_vertex(index)
+        for cell in self._grid.adjacent(index):
+            self.update_vertex(cell)
+
+    def compute_shortest_path(self) -> List[int]:
+        """Expands inconsistent cells until the distance of target is exact.
+
+        Returns the indices in the order they were expanded, which is nothing
+        if no cell changed since the last call."""
+        g, rhs = self.g, self.rhs
+        target = self.target
+        neighbours = self._grid.neighbours
+        order = []
+        while self._heap:
+            top = self.top_key()
+            if not self._heap:
+                break
+            if top >= self.key(target) and rhs[target] == g[target]:
+                break
+            index = heappop(self._heap)[3]
+            del self._queued[index]
+            order.append(index)
+            if g[index] > rhs[index]:
+                g[index] = rhs[index]
+            else:
+                g[index] = INFINITY
+                self.update_vertex(index)
+            for neighbour in neighbours(index):
+                self.update_vertex(neighbour)
+        if order:
+            self.last_expanded = order
+        return order
+
+    def path(self) -> List[int]:
+        """Cell path from source to target along decreasing distances, empty if
+        target cannot be reached"""
+        g = self.g
+        index = self.target
+        if g[index] >= INFINITY:
+            return []
+        path = [index]
+        neighbours = self._grid.neighbours
+        while index != self.source:
+            index = min(neighbours(index), key=g.__getitem__)
+            path.append(index)
+        path.reverse()
+        return path
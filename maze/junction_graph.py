@@ -0,0 +1,137 @@
+from array import array
+from heapq import heappush, heappop
+from itertools import count
+from typing import Dict, List, Tuple
+from maze.grid import Grid, OPEN_TABLE
+
+# 1 for every open-direction mask which does not describe a corridor cell
+NOT_CORRIDOR_TABLE = bytes(int(bin(mask).count("1") != 2) for mask in range(256))
+
+
+class JunctionGraph:
+    """Maze contracted to its junctions, dead ends, start and end point.
+
+    Every corridor (a run of cells with exactly two open neighbours) between two
+    nodes becomes one edge which keeps the grid indices of its cells, so paths
+    found on the graph can be expanded back to cell paths."""
+
+    def __init__(self, grid: Grid):
+        self._grid = grid
+        # (node, other node, indices of the corridor cells from node to other)
+        self.edges: List[Tuple[int, int, array]] = []
+        # node -> [(edge id, other node)]
+        self.adjacency: Dict[int, List[Tuple[int, int]]] = {}
+        self.build()
+
+    def find_nodes(self) -> List[int]:
+        grid = self._grid
+        size = grid.size
+        open_cells = int.from_bytes(grid.values.translate(OPEN_TABLE), "little")
+        not_corridor = int.from_bytes(
+            grid.masks.translate(NOT_CORRIDOR_TABLE), "little"
+        )
+        flags = (open_cells & not_corridor).to_bytes(size, "little")
+        nodes = []
+        index = flags.find(1)
+        while index != -1:
+            nodes.append(index)
+            index = flags.find(1, index + 1)
+        for value in (2, 3):
+            index = grid.values.find(value)
+            while index != -1:
+                if not flags[index]:
+                    nodes.append(index)
+                index = grid.values.find(value, index + 1)
+        return nodes
+
+    def build(self) -> None:
+        neighbours = self._grid.neighbours
+        adjacency = self.adjacency
+        for node in self.find_nodes():
+            adjacency[node] = []
+        walked = bytearray(self._grid.size)
+        for node in adjacency:
+            for first in neighbours(node):
+                if first in adjacency:
+                    # adjacent nodes, add the edge only once
+                    if node < first:
+                        self.add_edge(node, first, array("l"))
+                    continue
+                if walked[first]:
+                    continue
+                run = array("l")
+                previous, current = node, first
+                while current not in adjacency:
+                    walked[current] = 1
+                    run.append(current)
+                    following = neighbours(current)
+                    if following[0] == previous:
+                        previous, current = current, following[1]
+                    else:
+                        previous, current = current, following[0]
+                self.add_edge(node, current, run)
+
+    def add_edge(self, node: int, other: int, run: array) -> None:
+        edge_id = len(self.edges)
+        self.edges.append((node, other, run))
+        self.adjacency[node].append((edge_id, other))
+        if other != node:
+            self.adjacency[other].append((edge_id, node))
+
+    def edge_length(self, edge_id: int) -> int:
+        return len(self.edges[edge_id][2]) + 1
+
+    def edge_cells(self, edge_id: int, from_node: int) -> List[int]:
+        """Corridor cells of an edge in walking order starting at from_node"""
+        node, _, run = self.edges[edge_id]
+        if node == from_node:
+            return list(run)
+        return list(reversed(run))
+
+    def search(
+        self, source: int, target: int = -1
+    ) -> Tuple[Dict[int, Tuple[int, int]], List[int]]:
+        """Dijkstra over the corridor lengths from the node source.
+
+        Returns {node: (previous node, edge id)} of the settled nodes (source is
+        its own previous node) and the nodes in the order they were settled.
+        The search stops when target is settled."""
+        if source not in self.adjacency:
+            raise ValueError(f"Grid index {source} is not a node of the graph!")
+        distances = {source: 0}
+        parents = {}
+        candidates = {source: (source, -1)}
+        order = []
+        tie = count()
+        heap = [(0, next(tie), source)]
+        while heap:
+            distance, _, node = heappop(heap)
+            if node in parents:
+                continue
+            parents[node] = candidates[node]
+            order.append(node)
+            if node == target:
+                break
+            for edge_id, other in self.adjacency[node]:
+                if other in parents:
+                    continue
+                new_distance = distance + self.edge_length(edge_id)
+                if other not in distances or new_distance < distances[other]:
+                    distances[other] = new_distance
+                    candidates[other] = (node, edge_id)
+                    heappush(heap, (new_distance, next(tie), other))
+        return parents, order
+
+    def expand(self, parents: Dict[int, Tuple[int, int]], target: int) -> List[int]:
+        """Cell path from the source of a search to the node target"""
+        if target not in parents:
+            return []
+        path = [target]
+        node = target
+        while parents[node][0] != node:
+            previous, edge_id = parents[node]
+            path += reversed(self.edge_cells(edge_id, previous))
+            path.append(previous)
+            node = previous
+        path.reverse()
+        return path
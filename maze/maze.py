@@ -1,27 +1,36 @@
-from cell.cell import Cell
-from matplotlib import pyplot as plt
-from matplotlib import colors as c
-from typing import List
+from array import array
+from collections import OrderedDict
+from typing import Iterable, List, Tuple
 import logging
+from maze.exceptions import InvalidList
+from maze.grid import Grid, CellConfig
+from maze.incremental import LifelongAStar
+from maze.junction_graph import JunctionGraph
+from maze.maze_io import MappedGrid, is_binary, write_binary, read_text
+from maze.stats import SolveStats, phase
+from maze.search import (
+    breadth_first_distances,
+    breadth_first_search,
+    reconstruct_path,
+)
 from maze.maze_utils import (
+    add_file_handler,
     verify_file,
-    find_value_in_config,
     verify_ending,
+    encode_row,
 )
 
-
 LOG_FILE = "sample.log"
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-file_handler = logging.FileHandler(LOG_FILE, "w")
-formatter = logging.Formatter("%(asctime)s:%(funcName)s:%(levelname)s:%(message)s")
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
 
 
-class InvalidList(Exception):
-    pass
+def configure_logging(
+    filename: str = LOG_FILE, level: int = logging.DEBUG
+) -> logging.FileHandler:
+    """Writes the log of the maze and its solvers to filename. Nothing is
+    written (or truncated) unless this is called."""
+    return add_file_handler(logger, filename, level)
 
 
 """ def full_path(width: int, filename: str = LOG_FILE):
@@ -69,15 +78,61 @@ def bfs_full_path(width: int, filename: str = LOG_FILE):
 class Maze:
     valid_values = {1: "C", 0: "W", 2: "S", 3: "E"}
     directions = {"up": (-1, 0), "down": (1, 0), "right": (0, 1), "left": (0, -1)}
+    # number of breadth first search trees kept for shortest_path queries
+    search_tree_cache_size = 8
 
-    def __init__(self, maze_config: List[List[int]]):
-        self.validate_input(maze_config)
-        self.validate_values(maze_config)
-        self.config_cells()
-        self.init_cell_neighbours()
+    def __init__(self, maze_config: List[List[int]], stats: SolveStats = None):
+        # phases are timed if stats is given, see MazeSolver
+        self.stats = stats
+        self.config = maze_config
         self._solution_path = []
         self._full_path = []
 
+    @classmethod
+    def from_grid(
+        cls,
+        grid: Grid,
+        starting_point: Tuple[int, int] = None,
+        ending_point: Tuple[int, int] = None,
+        stats: SolveStats = None,
+    ) -> "Maze":
+        """Builds a maze directly from a Grid, config is only created on request.
+        Start and end are searched in the grid, provided ones have to match."""
+        maze = cls.__new__(cls)
+        maze.stats = stats
+        with phase(stats, "validate"):
+            maze.validate_grid(grid)
+        maze._config = None
+        maze.grid = grid
+        with phase(stats, "index build"):
+            maze.index_cells(starting_point, ending_point)
+            maze.init_cell_neighbours()
+        maze._solution_path = []
+        maze._full_path = []
+        return maze
+
+    @property
+    def config(self):
+        if self._config is None:
+            values = self.grid.values
+            self._config = [
+                list(values[row : row + self._length])
+                for row in range(0, len(values), self._length)
+            ]
+        return self._config
+
+    @config.setter
+    def config(self, maze_config: List[List[int]]):
+        """Assigning a new config rebuilds the grid and drops cached indexes"""
+        with phase(self.stats, "validate"):
+            grid = self.validate_input(maze_config)
+            self.validate_grid(grid)
+        self._config = maze_config
+        self.grid = grid
+        with phase(self.stats, "index build"):
+            self.index_cells()
+            self.init_cell_neighbours()
+
     @property
     def solution_path(self):
         if self._solution_path:
@@ -100,50 +155,192 @@ class Maze:
     def length(self):
         return self._length
 
-    def validate_input(self, maze_config: List[List[int]]):
+    def validate_input(self, maze_config: List[List[int]]) -> Grid:
+        """Checks shape and values of maze_config in a single pass over its rows
+        and returns its values as Grid"""
         try:
-            self._length = len(maze_config[0])
-            self._width = len(maze_config)
-            for i in range(self._length):
-                for j in range(self._width):
-                    if maze_config[j][i] not in self.valid_values:
-                        raise InvalidList()
-        except (TypeError, InvalidList):
+            length = len(maze_config[0])
+            values = bytearray()
+            for line in maze_config:
+                if len(line) != length:
+                    raise InvalidList()
+                values.extend(line)
+        except (TypeError, ValueError, IndexError, KeyError, InvalidList):
+            raise InvalidList("Provided Inputs do not fit the maze criterion!")
+        self._width = len(maze_config)
+        self._length = length
+        if values.translate(None, bytes(self.valid_values)):
             raise InvalidList("Provided Inputs do not fit the maze criterion!")
+        return Grid(self._width, self._length, values)
 
-    def validate_values(self, maze_config: List[List[int]]):
-        try:
-            for value in self.valid_values.keys():
-                if not find_value_in_config(value, maze_config):
-                    raise InvalidList()
-            self.config = maze_config
-        except InvalidList:
+    def validate_grid(self, grid: Grid):
+        """Checks that the grid holds only valid values, cells, walls and exactly
+        one starting and one ending point"""
+        self._width = grid.width
+        self._length = grid.length
+        values = grid.values
+        if values.translate(None, bytes(self.valid_values)):
+            raise InvalidList("Provided Inputs do not fit the maze criterion!")
+        for value in self.valid_values.keys():
+            if value not in values:
+                raise InvalidList(
+                    "Either cells, a starting point or an ending point is missing!"
+                )
+        for value, name in ((2, "starting"), (3, "ending")):
+            first = values.index(value)
+            second = values.find(value, first + 1)
+            if second != -1:
+                raise InvalidList(
+                    f"Maze has more than one {name} point: "
+                    f"{grid.coords(first)} and {grid.coords(second)}!"
+                )
+
+    def index_cells(
+        self,
+        starting_point: Tuple[int, int] = None,
+        ending_point: Tuple[int, int] = None,
+    ):
+        """Start and end are taken from the grid, provided points (e.g. from the
+        header of a binary file) have to agree with it"""
+        self.cell_config = CellConfig(self.grid, self.valid_values)
+        self.starting_point = self.locate_point(2, starting_point, "starting")
+        self.ending_point = self.locate_point(3, ending_point, "ending")
+
+    def locate_point(
+        self, value: int, point: Tuple[int, int] = None, name: str = ""
+    ) -> Tuple[int, int]:
+        coords = self.grid.coords(self.grid.values.index(value))
+        if point is not None and tuple(point) != coords:
+            raise InvalidList(
+                f"Provided {name} point {tuple(point)} does not match the maze, "
+                f"which has it at {coords}!"
+            )
+        return coords
+
+    def init_cell_neighbours(self):
+        self.grid.init_masks()
+        self._junction_graph = None
+        self._search_trees = OrderedDict()
+        self._planner = None
+
+    def junction_graph(self) -> JunctionGraph:
+        """Contracted graph of the maze, built on first request"""
+        if self._junction_graph is None:
+            self._junction_graph = JunctionGraph(self.grid)
+        return self._junction_graph
+
+    def planner(self) -> LifelongAStar:
+        """Incremental search from the starting to the ending point, built on first
+        request and repaired by set_cell"""
+        if self._planner is None:
+            self._planner = LifelongAStar(
+                self.grid,
+                self.grid.index(*self.starting_point),
+                self.grid.index(*self.ending_point),
+            )
+        return self._planner
+
+    def set_cell(self, x: int, y: int, value: int):
+        """Changes a single cell, e.g. opens or closes a wall, without rebuilding
+        the maze. Only the masks around the cell are recomputed. A new starting
+        or ending point replaces the old one, which becomes a cell."""
+        if value not in self.valid_values:
+            raise InvalidList("Provided Inputs do not fit the maze criterion!")
+        if not self.grid.contains(x, y):
+            raise ValueError(f"{(x, y)} is not part of the maze!")
+        point = (x, y)
+        if (point == self.starting_point and value != 2) or (
+            point == self.ending_point and value != 3
+        ):
             raise InvalidList(
                 "Either cells, a starting point or an ending point is missing!"
             )
+        grid = self.grid
+        index = grid.index(x, y)
+        if grid.values[index] == value:
+            return
+        if value in (2, 3):
+            # the old point stays open, so its masks do not change
+            old_point = self.starting_point if value == 2 else self.ending_point
+            grid.values[grid.index(*old_point)] = 1
+            if value == 2:
+                self.starting_point = point
+            else:
+                self.ending_point = point
+            self._planner = None
+        grid.set_value(index, value)
+        self._config = None
+        self.cell_config = CellConfig(grid, self.valid_values)
+        self._junction_graph = None
+        self._search_trees.clear()
+        if self._planner is not None:
+            self._planner.update_cell(index)
 
-    def config_cells(self):
-        self.cell_config = {}
-        for i in range(self._length):
-            for j in range(self._width):
-                typing = self.config[j][i]
-                self.cell_config[(j + 1, i + 1)] = Cell(
-                    j + 1, i + 1, self.valid_values[typing]
-                )
-                if typing == 2:
-                    self.starting_point = (j + 1, i + 1)
-                elif typing == 3:
-                    self.ending_point = (j + 1, i + 1)
+    def distance_field(self, source: Tuple[int, int] = None) -> array:
+        """Shortest path distance from source (the starting point by default) to
+        every cell as a flat array('i') of width * length values in row-major
+        order, -1 for walls and unreachable cells. It is not reshaped so that
+        the core of the package does not import NumPy."""
+        if source is None:
+            source = self.starting_point
+        return breadth_first_distances(self.grid, self.cell_index(source))
 
-    def init_cell_neighbours(self):
-        for coords, cell in self.cell_config.items():
-            x, y = coords
-            if cell._typing != "W":
-                for key, direction in self.directions.items():
-                    x_shift, y_shift = direction
-                    if (x + x_shift, y + y_shift) in self.cell_config:
-                        if self.cell_config[(x + x_shift, y + y_shift)]._typing != "W":
-                            cell._neighbours[key] = (x + x_shift, y + y_shift)
+    def cell_index(self, point: Tuple[int, int]) -> int:
+        """Grid index of point, which has to be a cell of the maze"""
+        if (
+            not self.grid.contains(*point)
+            or not self.grid.values[self.grid.index(*point)]
+        ):
+            raise ValueError(f"{point} is not a cell of the maze!")
+        return self.grid.index(*point)
+
+    def search_tree(self, source: int) -> array:
+        """Parent indices of a breadth first search from the grid index source.
+        The trees of the search_tree_cache_size most recently used sources are
+        kept until the grid changes."""
+        trees = self._search_trees
+        if source in trees:
+            trees.move_to_end(source)
+            return trees[source]
+        parents, _ = breadth_first_search(self.grid, source)
+        trees[source] = parents
+        if len(trees) > self.search_tree_cache_size:
+            trees.popitem(last=False)
+        return parents
+
+    def shortest_path(
+        self, start: Tuple[int, int], end: Tuple[int, int]
+    ) -> List[Tuple[int, int]]:
+        """Shortest path between any two cells in maze coordinates, empty if end
+        cannot be reached. Repeated queries from a cached start (or to a cached
+        end) only walk up the parent indices."""
+        source, target = self.cell_index(start), self.cell_index(end)
+        if target in self._search_trees and source not in self._search_trees:
+            path = reconstruct_path(self.search_tree(target), source)
+            path.reverse()
+        else:
+            path = reconstruct_path(self.search_tree(source), target)
+        return [self.grid.coords(index) for index in path]
+
+    def shortest_paths(
+        self, pairs: Iterable[Tuple[Tuple[int, int], Tuple[int, int]]]
+    ) -> List[List[Tuple[int, int]]]:
+        """shortest_path for many (start, end) pairs, in the order of pairs.
+        Pairs are grouped by start, so every start is searched at most once."""
+        pairs = list(pairs)
+        groups = {}
+        for position, (start, end) in enumerate(pairs):
+            targets = groups.setdefault(self.cell_index(start), [])
+            targets.append((position, self.cell_index(end)))
+        paths = [None] * len(pairs)
+        coords = self.grid.coords
+        for source, targets in groups.items():
+            parents = self.search_tree(source)
+            for position, target in targets:
+                paths[position] = [
+                    coords(index) for index in reconstruct_path(parents, target)
+                ]
+        return paths
 
     def __str__(self):
         rep = ""
@@ -167,6 +364,10 @@ class Maze:
         return rep
 
     def view_maze(self) -> None:
+        # matplotlib takes long to import, only load it when plotting
+        from matplotlib import pyplot as plt
+        from matplotlib import colors as c
+
         fig, ax = plt.subplots()
         cmap = c.ListedColormap(["indigo", "darkcyan", "yellow", "lime"])
         ax.pcolormesh([item for item in reversed(self.config)], cmap=cmap)
@@ -183,24 +384,23 @@ class Maze:
         if not filename:
             filename = f"maze_examples/maze_{self.length+1}_{self.width+1}.txt"
         verify_ending(filename)
-        with open(filename, "w") as file:
-            for line in self.config:
-                export_str = " ".join(f"{number}" for number in line)
-                export_str += "\n"
-                file.write(export_str)
+        if is_binary(filename):
+            write_binary(filename, self.grid, self.starting_point, self.ending_point)
+            return
+        values = self.grid.values
+        with open(filename, "wb") as file:
+            for row in range(0, len(values), self._length):
+                file.write(encode_row(values[row : row + self._length]))
 
     @classmethod
-    def import_maze(cls, filename: str, delimiter: str = " "):
+    def import_maze(cls, filename: str, delimiter: str = " ", stats: SolveStats = None):
         verify_file(filename)
-        config = []
-        with open(filename, "r") as file:
-            try:
-                for line in file.readlines():
-                    line = line.replace("\n", "")
-                    line_config = [int(number) for number in line.split(delimiter)]
-                    config.append(line_config)
-            except (TypeError, ValueError):
-                raise TypeError(
-                    "Provided input includes values which cannot be converted to int!"
-                )
-        return cls(config)
+        with phase(stats, "import"):
+            if is_binary(filename):
+                with MappedGrid(filename) as mapped_grid:
+                    grid = mapped_grid.to_grid()
+                    starting_point = mapped_grid.starting_point
+                    ending_point = mapped_grid.ending_point
+            else:
+                grid, starting_point, ending_point = read_text(filename, delimiter)
+        return cls.from_grid(grid, starting_point, ending_point, stats)
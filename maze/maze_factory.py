@@ -1,53 +1,41 @@
 from abc import abstractmethod
 from abc import ABC
-from cell.cell import Cell
 import random
 import logging
-from maze.maze_utils import add_tuples, verify_ending
+from array import array
+from typing import Iterator, Union
+from maze.grid import Grid
+from maze.maze_utils import add_file_handler, verify_ending, encode_row
+from maze.maze_io import is_binary, write_binary, write_rows
 
 LOG_FILE = "sample_factory.log"
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-file_handler = logging.FileHandler(LOG_FILE, "w")
-formatter = logging.Formatter("%(asctime)s:%(funcName)s:%(levelname)s:%(message)s")
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
-
-
-def update_turning_points(turning_points, visited_cells, cells_neighbours):
-    for point in list(turning_points):
-        index = 0
-        neighbour_list = cells_neighbours[point]._neighbours
-        size = len(neighbour_list)
-        for key, value in dict(neighbour_list).items():
-            if value in visited_cells:
-                index += 1
-                del neighbour_list[key]
-        if size == index:
-            turning_points.remove(point)
-
-
-def inverse_move(move: str):
-    if move == "up":
-        return "down"
-    elif move == "down":
-        return "up"
-    elif move == "right":
-        return "left"
-    elif move == "left":
-        return "right"
-    else:
-        raise ValueError(f"{move} is an invalid input!")
+
+
+def configure_logging(
+    filename: str = LOG_FILE, level: int = logging.DEBUG
+) -> logging.FileHandler:
+    """Writes the log of the maze factories to filename. Nothing is written
+    (or truncated) unless this is called."""
+    return add_file_handler(logger, filename, level)
 
 
 class MazeFactory(ABC):
     directions = {"up": (-2, 0), "down": (2, 0), "right": (0, 2), "left": (0, -2)}
     wall_directions = {"up": (-1, 0), "down": (1, 0), "right": (0, 1), "left": (0, -1)}
 
-    def __init__(self, width: int, length: int):
+    def __init__(self, width: int, length: int, seed: Union[int, random.Random] = None):
+        """seed is either a seed for a new random generator or a random.Random
+        instance to draw from, equal seeds create equal mazes"""
         self.width = width
         self.length = length
+        if isinstance(seed, random.Random):
+            self._random = seed
+        else:
+            self._random = random.Random(seed)
+        self._maze = []
+        self._values = bytearray()
 
     @property
     def width(self):
@@ -77,115 +65,270 @@ class MazeFactory(ABC):
     def create_maze(self) -> list:
         """Implementation of a maze as a lists of 0 and 1"""
 
-
-class DFSMaze(MazeFactory):
-    def __init__(self, width: int, length: int):
-        super().__init__(width, length)
+    def init_maze_procedure(self):
+        """Cells of the maze sit on the even rows and columns of a
+        (2 * width - 1) x (2 * length - 1) grid which starts as walls only"""
+        if self._width * self._length < 2:
+            raise ValueError("A maze needs at least two cells!")
+        self._rows = 2 * self._width - 1
+        self._columns = 2 * self._length - 1
+        self._values = bytearray(self._rows * self._columns)
         self._maze = []
 
-    def init_maze_procedure(self):
-        self._cells = {
-            (2 * i + 1, 2 * j + 1): Cell(2 * i + 1, 2 * j + 1, "C")
-            for i in range(self._width)
-            for j in range(self._length)
-        }
-        self._walls = {
-            (i + 1, j + 1): Cell(i + 1, j + 1, "W")
-            for i in range(2 * self._width - 1)
-            for j in range(2 * self._length - 1)
-            if (i + 1, j + 1) not in self._cells
-        }
-        self._visited_cells = []
-        self.init_cell_neighbours()
+    def place_points(self):
+        self._values[self.random_cell()] = 2
+        self._values[self.random_cell()] = 3
+        logger.debug("Created maze of size %sx%s", self._rows, self._columns)
 
-    def create_maze(self):
-        self.init_maze_procedure()
-        key = random.choice(list(self._cells.keys()))
-        total_amount = self._width * self._length
-        current_point = key
-        turning_points = []
-        while len(self._visited_cells) < total_amount - 1:
-            # delete the current point out of the neighbours
-            size = len(self._cells[current_point]._neighbours.items())
-            for move, coords in self._cells[current_point]._neighbours.items():
-                if inverse_move(move) in self._cells[coords]._neighbours.keys():
-                    del self._cells[coords]._neighbours[inverse_move(move)]
-
-            if size == 0:
-                next_point = turning_points[-1]
-                turning_points.remove(turning_points[-1])
-                logger.debug(
-                    f"Current Point {current_point} has 0 neighbour! Next Point {next_point}"
-                )
-            elif size == 1:
-                if current_point in turning_points:
-                    turning_points.remove(current_point)
-                next_point = self.update_step(current_point)
-                self._visited_cells.append(next_point)
-                logger.debug(
-                    f"Current Point {current_point} has 1 neighbour! Next Point {next_point}"
-                )
-            else:
-                if current_point not in turning_points:
-                    turning_points.append(current_point)
-
-                next_point = self.update_step(current_point)
-                self._visited_cells.append(next_point)
-                logger.debug(
-                    f"Current Point {current_point} has more than 1 neighbour! Next Point {next_point}"
-                )
-
-            current_point = next_point
-            update_turning_points(turning_points, self._visited_cells, self._cells)
-
-        self._maze = self.maze_list()
-
-    def update_step(self, current_point: tuple) -> tuple:
-        key = random.choice(list(self._cells[current_point]._neighbours.keys()))
-        next_point = self._cells[current_point]._neighbours[key]
-        wall_point = add_tuples(current_point, self.wall_directions[key])
-        self._cells[wall_point] = self._walls[wall_point]
-        del self._walls[wall_point]
-        del self._cells[current_point]._neighbours[key]
-        return next_point
-
-    def init_cell_neighbours(self) -> None:
-        for coords, cell in self._cells.items():
-            for key, move in self.directions.items():
-                if add_tuples(coords, move) in self._cells:
-                    cell._neighbours[key] = add_tuples(coords, move)
+    def random_cell(self) -> int:
+        """Position of a random open cell which is neither start nor end"""
+        size = len(self._values)
+        while True:
+            position = self._random.randrange(size)
+            if self._values[position] == 1:
+                return position
 
     def maze_list(self) -> list:
-        maze = [
-            [-1 for _ in range(2 * self._length - 1)]
-            for _ in range(2 * self._width - 1)
+        values = self.grid.values
+        columns = self._columns
+        return [
+            list(values[row : row + columns]) for row in range(0, len(values), columns)
         ]
-        for coords in self._cells.keys():
-            i, j = coords
-            maze[i - 1][j - 1] = 1
-        for coords in self._walls.keys():
-            i, j = coords
-            maze[i - 1][j - 1] = 0
-        starting_point = random.choice(list(self._cells.keys()))
-        i, j = starting_point
-        maze[i - 1][j - 1] = 2
-        end_point = random.choice(list(self._cells.keys()))
-        i, j = end_point
-        maze[i - 1][j - 1] = 3
-        return maze
 
     def export_maze(self, filename: str):
         verify_ending(filename)
-        maze = self.maze
-        with open(filename, "w") as file:
-            for line in maze:
-                export_str = " ".join(f"{number}" for number in line)
-                export_str += "\n"
-                file.write(export_str)
+        grid = self.grid
+        if is_binary(filename):
+            starting_point = grid.coords(grid.values.index(2))
+            ending_point = grid.coords(grid.values.index(3))
+            write_binary(filename, grid, starting_point, ending_point)
+            return
+        columns = self._columns
+        with open(filename, "wb") as file:
+            for row in range(0, grid.size, columns):
+                file.write(encode_row(grid.values[row : row + columns]))
 
     @property
-    def maze(self):
-        if self._maze:
-            return self._maze
+    def grid(self) -> Grid:
+        if self._values:
+            return Grid(self._rows, self._columns, self._values)
         else:
             raise ValueError("Maze has not been created yet. Use create_maze()!")
+
+    @property
+    def maze(self):
+        if not self._maze:
+            self._maze = self.maze_list()
+        return self._maze
+
+
+class DFSMaze(MazeFactory):
+    """Recursive backtracker on an explicit stack. Cells sit on the even rows and
+    columns of a (2 * width - 1) x (2 * length - 1) grid of walls and are set to 1
+    as soon as they are visited, so the grid doubles as visited bitmap."""
+
+    def create_maze(self):
+        self.init_maze_procedure()
+        values = self._values
+        columns = self._columns
+        size = len(values)
+        row_step = 2 * columns
+        last_column = columns - 1
+        choice = self._random.choice
+        current_point = 2 * self._random.randrange(self._width) * columns
+        current_point += 2 * self._random.randrange(self._length)
+        values[current_point] = 1
+        stack = [current_point]
+        while stack:
+            current_point = stack[-1]
+            column = current_point % columns
+            candidates = []
+            if current_point >= row_step and not values[current_point - row_step]:
+                candidates.append(current_point - row_step)
+            if current_point + row_step < size and not values[current_point + row_step]:
+                candidates.append(current_point + row_step)
+            if column < last_column and not values[current_point + 2]:
+                candidates.append(current_point + 2)
+            if column and not values[current_point - 2]:
+                candidates.append(current_point - 2)
+            if not candidates:
+                stack.pop()
+                continue
+            next_point = choice(candidates)
+            # open the wall between both cells
+            values[(current_point + next_point) // 2] = 1
+            values[next_point] = 1
+            stack.append(next_point)
+
+        self.place_points()
+
+
+class KruskalMaze(MazeFactory):
+    """Randomized Kruskal: the walls between neighbouring cells are visited in
+    random order and opened whenever they separate two different sets of cells.
+    The sets are a union-find with path halving over a flat parent array of the
+    cell indices."""
+
+    def create_maze(self):
+        self.init_maze_procedure()
+        values = self._values
+        columns = self._columns
+        length = self._length
+        for row in range(0, len(values), 2 * columns):
+            values[row : row + columns : 2] = b"\x01" * length
+        # wall 2 * cell separates cell from its right neighbour,
+        # wall 2 * cell + 1 from the cell below
+        walls = array("l")
+        for row in range(self._width):
+            start = 2 * row * length
+            walls.extend(range(start, start + 2 * length - 2, 2))
+            if row < self._width - 1:
+                walls.extend(range(start + 1, start + 2 * length, 2))
+        self._random.shuffle(walls)
+        steps = (1, length)
+        parent = array("l", range(self._width * length))
+        unions = len(parent) - 1
+        for wall in walls:
+            cell = wall >> 1
+            other = cell + steps[wall & 1]
+            while parent[cell] != cell:
+                parent[cell] = parent[parent[cell]]
+                cell = parent[cell]
+            while parent[other] != other:
+                parent[other] = parent[parent[other]]
+                other = parent[other]
+            if cell == other:
+                continue
+            parent[cell] = other
+            # the wall sits right of or below the cell of wall
+            row, column = divmod(wall >> 1, length)
+            values[2 * row * columns + 2 * column + (columns if wall & 1 else 1)] = 1
+            unions -= 1
+            if not unions:
+                break
+
+        self.place_points()
+
+
+class WilsonMaze(MazeFactory):
+    """Wilson's algorithm: loop-erased random walks from every cell not yet in the
+    maze until they hit it, which draws uniformly from all perfect mazes.
+
+    The walks run on the cell indices of a grid padded with a border of one cell,
+    so stepping out of the maze is a lookup instead of a bounds check. Loops are
+    erased implicitly by overwriting the step taken last from a cell."""
+
+    def create_maze(self):
+        self.init_maze_procedure()
+        values = self._values
+        columns = self._columns
+        padded_length = self._length + 2
+        size = (self._width + 2) * padded_length
+        border = bytearray(b"\x01") * size
+        for row in range(padded_length, size - padded_length, padded_length):
+            border[row + 1 : row + padded_length - 1] = bytes(self._length)
+        in_maze = bytearray(border)
+        next_cell = array("l", [0]) * size
+        offsets = (-padded_length, padded_length, 1, -1)
+        getrandbits = self._random.getrandbits
+
+        def position(cell: int) -> int:
+            row, column = divmod(cell, padded_length)
+            return 2 * (row - 1) * columns + 2 * (column - 1)
+
+        cells = [cell for cell in range(size) if not border[cell]]
+        root = cells[self._random.randrange(len(cells))]
+        values[position(root)] = 1
+        in_maze[root] = 1
+        for start in cells:
+            if in_maze[start]:
+                continue
+            current = start
+            while not in_maze[current]:
+                step = current + offsets[getrandbits(2)]
+                while border[step]:
+                    step = current + offsets[getrandbits(2)]
+                next_cell[current] = step
+                current = step
+            current = start
+            current_position = position(current)
+            while not in_maze[current]:
+                in_maze[current] = 1
+                current = next_cell[current]
+                next_position = position(current)
+                values[current_position] = 1
+                values[(current_position + next_position) // 2] = 1
+                current_position = next_position
+
+        self.place_points()
+
+
+class EllerMaze(MazeFactory):
+    """Eller's algorithm, which only keeps the sets of the cells of one row.
+
+    rows() yields the rows of the (2 * width - 1) x (2 * length - 1) grid one
+    after the other, so stream_maze() writes mazes far too large for memory.
+    The starting point is placed in the first and the ending point in the last
+    row of cells."""
+
+    def rows(self) -> Iterator[bytearray]:
+        if self._width * self._length < 2:
+            raise ValueError("A maze needs at least two cells!")
+        length = self._length
+        columns = 2 * length - 1
+        getrandbits = self._random.getrandbits
+        randrange = self._random.randrange
+        starting_column = randrange(length)
+        ending_column = randrange(length)
+        while self._width == 1 and ending_column == starting_column:
+            ending_column = randrange(length)
+        # set of every cell in the current row
+        labels = list(range(length))
+        next_label = length
+        for x in range(self._width):
+            last = x == self._width - 1
+            members = {}
+            for column, label in enumerate(labels):
+                members.setdefault(label, []).append(column)
+            row = bytearray(columns)
+            row[::2] = b"\x01" * length
+            # join neighbouring cells of different sets at random, all in the last row
+            for column in range(length - 1):
+                label, other = labels[column], labels[column + 1]
+                if label == other or not (last or getrandbits(1)):
+                    continue
+                row[2 * column + 1] = 1
+                if len(members[label]) < len(members[other]):
+                    label, other = other, label
+                for cell in members[other]:
+                    labels[cell] = label
+                members[label] += members.pop(other)
+            if not x:
+                row[2 * starting_column] = 2
+            if last:
+                row[2 * ending_column] = 3
+            yield row
+            if last:
+                return
+            # every set continues downwards at least once
+            passages = bytearray(columns)
+            for cells in members.values():
+                down = [cell for cell in cells if getrandbits(1)]
+                if not down:
+                    down = [cells[randrange(len(cells))]]
+                for cell in down:
+                    passages[2 * cell] = 1
+            yield passages
+            for column in range(length):
+                if not passages[2 * column]:
+                    labels[column] = next_label
+                    next_label += 1
+
+    def create_maze(self):
+        self.init_maze_procedure()
+        self._values = bytearray().join(self.rows())
+
+    def stream_maze(self, filename: str):
+        """Writes a new maze to filename row by row without keeping it in memory"""
+        verify_ending(filename)
+        write_rows(filename, self.rows(), 2 * self._width - 1, 2 * self._length - 1)
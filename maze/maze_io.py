@@ -0,0 +1,223 @@
+import mmap
+import os
+import struct
+from typing import Iterable, NamedTuple, Tuple
+from maze.exceptions import InvalidList
+from maze.grid import Grid
+from maze.maze_utils import encode_row
+
+# binary maze files: a fixed header followed by the cell values packed with
+# 2 bits per cell, four cells per byte starting at the lowest bits
+MAGIC = b"MAZE"
+VERSION = 1
+# magic, version, reserved, width, length, starting point, ending point
+HEADER = struct.Struct("<4sHHIIIIII")
+BINARY_ENDING = "maze"
+
+# SHIFT_TABLES[k] moves a cell value to its bits in a packed byte,
+# UNPACK_TABLES[k] reads it back
+SHIFT_TABLES = [bytes((value & 3) << 2 * k for value in range(256)) for k in range(4)]
+UNPACK_TABLES = [bytes((byte >> 2 * k) & 3 for byte in range(256)) for k in range(4)]
+
+
+# maps ascii digits to their value and everything else to 255
+DIGIT_VALUES_TABLE = bytes(48 * [255]) + bytes(range(10)) + bytes(198 * [255])
+VALID_VALUES = bytes([0, 1, 2, 3])
+
+
+class MazeHeader(NamedTuple):
+    width: int
+    length: int
+    starting_point: Tuple[int, int]
+    ending_point: Tuple[int, int]
+
+
+def is_binary(path: str) -> bool:
+    return path.split(".")[-1] == BINARY_ENDING
+
+
+def pack_values(values: bytes) -> bytes:
+    """Packs cell values (0-3) into 2 bits each"""
+    values = bytes(values) + bytes(-len(values) % 4)
+    packed = 0
+    for k in range(4):
+        packed |= int.from_bytes(values[k::4].translate(SHIFT_TABLES[k]), "little")
+    return packed.to_bytes(len(values) // 4, "little")
+
+
+def unpack_values(packed: bytes, size: int) -> bytearray:
+    """Reads size cell values back from their packed form"""
+    values = bytearray(4 * len(packed))
+    for k in range(4):
+        values[k::4] = packed.translate(UNPACK_TABLES[k])
+    del values[size:]
+    return values
+
+
+def decode_row(line: bytes, delimiter: bytes = b" ") -> bytes:
+    """Cell values of a text line like b"0 1 2". Lines of single digits
+    separated by a single byte delimiter are decoded without splitting."""
+    if (
+        len(delimiter) == 1
+        and len(line) % 2
+        and line[1::2] == delimiter * (len(line) // 2)
+    ):
+        row = line[0::2].translate(DIGIT_VALUES_TABLE)
+        if 255 not in row:
+            return row
+    try:
+        numbers = [int(number) for number in line.split(delimiter)]
+    except ValueError:
+        raise TypeError(
+            "Provided input includes values which cannot be converted to int!"
+        )
+    if not all(0 <= number <= 255 for number in numbers):
+        raise InvalidList("Provided Inputs do not fit the maze criterion!")
+    return bytes(numbers)
+
+
+def read_text(
+    filename: str, delimiter: str = " "
+) -> Tuple[Grid, Tuple[int, int], Tuple[int, int]]:
+    """Streams a text maze line by line into a Grid, checking the width of every
+    row and its values on the way.
+
+    Returns the grid with the first starting and ending point found."""
+    separator = delimiter.encode()
+    values = bytearray()
+    length = None
+    points = {2: None, 3: None}
+    width = 0
+    with open(filename, "rb") as file:
+        for line in file:
+            row = decode_row(line.rstrip(b"\r\n"), separator)
+            if length is None:
+                length = len(row)
+            if len(row) != length or row.translate(None, VALID_VALUES):
+                raise InvalidList("Provided Inputs do not fit the maze criterion!")
+            width += 1
+            for value, point in points.items():
+                if point is None and value in row:
+                    points[value] = (width, row.index(value) + 1)
+            values += row
+    if not width or not length:
+        raise InvalidList("Provided Inputs do not fit the maze criterion!")
+    return Grid(width, length, values), points[2], points[3]
+
+
+def write_binary(
+    filename: str,
+    grid: Grid,
+    starting_point: Tuple[int, int],
+    ending_point: Tuple[int, int],
+) -> None:
+    header = HEADER.pack(
+        MAGIC, VERSION, 0, grid.width, grid.length, *starting_point, *ending_point
+    )
+    with open(filename, "wb") as file:
+        file.write(header)
+        file.write(pack_values(grid.values))
+
+
+def write_rows(filename: str, rows: Iterable[bytes], width: int, length: int) -> None:
+    """Writes the rows of a maze one at a time, packed into the binary format for
+    .maze files and as text otherwise, so the maze never has to be in memory
+    as a whole. The binary header is written last as the starting and ending
+    point are only known once they have been passed."""
+    if not is_binary(filename):
+        with open(filename, "wb") as file:
+            for row in rows:
+                file.write(encode_row(row))
+        return
+    points = {2: (0, 0), 3: (0, 0)}
+    pending = bytearray()
+    with open(filename, "wb") as file:
+        file.write(bytes(HEADER.size))
+        for x, row in enumerate(rows, 1):
+            for value in points:
+                y = row.find(value)
+                if y != -1:
+                    points[value] = (x, y + 1)
+            pending += row
+            complete = len(pending) - len(pending) % 4
+            file.write(pack_values(pending[:complete]))
+            del pending[:complete]
+        file.write(pack_values(pending))
+        file.seek(0)
+        file.write(
+            HEADER.pack(MAGIC, VERSION, 0, width, length, *points[2], *points[3])
+        )
+
+
+def read_header(buffer: bytes) -> MazeHeader:
+    if len(buffer) < HEADER.size:
+        raise ValueError("Provided file is too short for a binary maze file!")
+    magic, version, _, width, length, *points = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("Provided file is not a binary maze file!")
+    if version != VERSION:
+        raise ValueError(f"Binary maze file version {version} is not supported!")
+    if len(buffer) < HEADER.size + (width * length + 3) // 4:
+        raise ValueError("Provided binary maze file is truncated!")
+    return MazeHeader(width, length, tuple(points[:2]), tuple(points[2:]))
+
+
+class MappedGrid:
+    """Binary maze file mapped into memory. Single cells are read straight from
+    the mapped buffer, to_grid() unpacks all of them at once."""
+
+    def __init__(self, filename: str):
+        with open(filename, "rb") as file:
+            # mmap refuses empty files, which are just too short as well
+            if not os.fstat(file.fileno()).st_size:
+                read_header(b"")
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.header = read_header(self._buffer)
+        except ValueError:
+            self._buffer.close()
+            raise
+
+    @property
+    def width(self) -> int:
+        return self.header.width
+
+    @property
+    def length(self) -> int:
+        return self.header.length
+
+    @property
+    def starting_point(self) -> Tuple[int, int]:
+        return self.header.starting_point
+
+    @property
+    def ending_point(self) -> Tuple[int, int]:
+        return self.header.ending_point
+
+    def __len__(self) -> int:
+        return self.header.width * self.header.length
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < len(self):
+            raise IndexError(f"Grid index {index} is out of range!")
+        byte = self._buffer[HEADER.size + index // 4]
+        return (byte >> 2 * (index % 4)) & 3
+
+    def value(self, x: int, y: int) -> int:
+        if not (0 < x <= self.width and 0 < y <= self.length):
+            raise IndexError(f"Coordinates {(x, y)} are out of range!")
+        return self[(x - 1) * self.length + (y - 1)]
+
+    def to_grid(self) -> Grid:
+        size = len(self)
+        packed = self._buffer[HEADER.size : HEADER.size + (size + 3) // 4]
+        return Grid(self.width, self.length, unpack_values(packed, size))
+
+    def close(self) -> None:
+        self._buffer.close()
+
+    def __enter__(self) -> "MappedGrid":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -1,7 +1,20 @@
+import logging
 import os
-import random
 from typing import Tuple, List, Dict
 
+LOG_FORMAT = "%(asctime)s:%(funcName)s:%(levelname)s:%(message)s"
+
+
+def add_file_handler(
+    logger: logging.Logger, filename: str, level: int = logging.DEBUG
+) -> logging.FileHandler:
+    """Attaches a handler to logger which truncates filename on the first record"""
+    file_handler = logging.FileHandler(filename, "w", delay=True)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logger.addHandler(file_handler)
+    logger.setLevel(level)
+    return file_handler
+
 
 def transform_single_coordinates(tup: Tuple[int], width):
     x, y = tup
@@ -14,6 +27,10 @@ def transform_coordinates(
     return [transform_single_coordinates(tup, width) for tup in path]
 
 
+def transform_indices(path: List[int], grid) -> List[Tuple[int, int]]:
+    return transform_coordinates([grid.coords(index) for index in path], grid.width)
+
+
 def retransform_coordinates(
     path: List[Tuple[int, int]], width: int
 ) -> List[Tuple[int, int]]:
@@ -30,22 +47,34 @@ def add_tuples(t1: tuple, t2: tuple):
     return tuple(s + t for s, t in zip(t1, t2))
 
 
+# text files hold space separated values, maze files the packed binary format
+FILE_ENDINGS = ("txt", "maze")
+
+
 def verify_file(path: str):
     if not os.path.isfile(path):
         raise ValueError(f"Provided path {path} does not lead to a file!")
-    if not path.split(".")[-1] == "txt":
-        raise TypeError(
-            f"Provided file must be a txt file, not a {path.split('.')[-1]} file!"
-        )
+    verify_ending(path)
 
 
 def verify_ending(path: str):
-    if not path.split(".")[-1] == "txt":
+    if not path.split(".")[-1] in FILE_ENDINGS:
         raise TypeError(
-            f"Provided file must be a txt file, not a {path.split('.')[-1]} file!"
+            f"Provided file must be a txt or maze file, not a {path.split('.')[-1]} file!"
         )
 
 
+# maps the cell values 0-9 to their ascii digits
+DIGITS_TABLE = bytes(range(48, 58)) + bytes(246)
+
+
+def encode_row(values: bytes) -> bytes:
+    """Text line of a maze row, e.g. b"0 1 2\\n" for the values 0, 1 and 2"""
+    line = bytearray(b" " * (2 * len(values) - 1) + b"\n")
+    line[: 2 * len(values) : 2] = values.translate(DIGITS_TABLE)
+    return bytes(line)
+
+
 def subtract_tuples(t1: tuple, t2: tuple):
     return tuple(s - t for s, t in zip(t1, t2))
 
@@ -60,53 +89,17 @@ def find_value_in_config(value: int, maze_config: List[List[int]]):
     return False
 
 
-def construct_bfs_path(key_index: str, dict_path: Dict[str, List[Tuple[int, int]]]):
-    delimiter = "."
-    if delimiter in key_index:
-        numbers = key_index.split(delimiter)
-        key_indices = [
-            ".".join(number for number in numbers[: i + 1])
-            for i, _ in enumerate(numbers)
-        ]
-        path = []
-        for key in key_indices:
-            path += dict_path[key]
-        return path
-    else:
-        return dict_path[key_index]
-
-
-def compute_lower_number(key: str, key_numbers: Dict[str, int]):
-    value = 0
-    for sub_key, number in key_numbers.items():
-        if len(key) > len(sub_key):
-            if key[0 : len(sub_key)] == sub_key:
-                value += number
-    return value
-
-
-def compute_upper_number(key: str, key_numbers: Dict[str, int]):
-    value = 0
-    for sub_key, number in key_numbers.items():
-        if len(key) >= len(sub_key):
-            if key[0 : len(sub_key)] == sub_key:
-                value += number
-    return value
-
-
-def find_keys(key: str, key_indices: List[str]):
-    return [sub_key for sub_key in key_indices if sub_key[0 : len(key)] == key]
-
-
-def select_direction(
-    end_point: Tuple[int, int], neighbours: Dict[str, Tuple[int, int]]
-):
-    # print(neighbours)
-    rev_dict = {coords: move for move, coords in neighbours.items()}
-    if end_point in rev_dict:
-        return rev_dict[end_point]
-    else:
-        return random.choice(list(neighbours.keys()))
+def compute_key_offsets(key_numbers: Dict[str, int]) -> Dict[str, int]:
+    """Total number of points on the ancestor branches of every key.
+    Parent keys ("1.2") have to come before their children ("1.2.1")."""
+    key_offsets = {}
+    for key, number in key_numbers.items():
+        parent = key.rpartition(".")[0]
+        if parent:
+            key_offsets[key] = key_offsets[parent] + key_numbers[parent]
+        else:
+            key_offsets[key] = 0
+    return key_offsets
 
 
 def create_path_direction_dict(
@@ -125,19 +118,6 @@ def create_path_direction_dict(
     return plot_dict
 
 
-def remove_coords_from_maze_path(
-    maze_path: Dict[int, Dict[str, Tuple[int, int]]],
-    current_neighbours: Dict[str, Tuple[int, int]],
-) -> None:
-    key_list = []
-    for values in maze_path.values():
-        for key, coords in current_neighbours.items():
-            if coords in values:
-                key_list.append(key)
-    for key in key_list:
-        del current_neighbours[key]
-
-
 def opposite_direction(direction: str):
     opposite_directions = {"up": "down", "down": "up", "right": "left", "left": "right"}
     return opposite_directions[direction]
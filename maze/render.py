@@ -0,0 +1,177 @@
+import os
+from typing import Iterator, List, Sequence, Tuple
+import numpy as np
+from PIL import Image
+from maze.grid import Grid
+
+# colours of the cell values like in Maze.view_maze, then the path and a
+# gradient from the first to the last visited cell
+CELL_COLOURS = [(75, 0, 130), (0, 139, 139), (255, 255, 0), (0, 255, 0)]
+PATH_COLOUR = (240, 128, 128)
+VISITED_FIRST = (176, 224, 230)
+VISITED_LAST = (70, 130, 180)
+GRADIENT_LEVELS = 64
+
+PATH = len(CELL_COLOURS)
+VISITED = PATH + 1
+PALETTE = np.array(
+    CELL_COLOURS
+    + [PATH_COLOUR]
+    + [
+        tuple(
+            round(first + (last - first) * level / (GRADIENT_LEVELS - 1))
+            for first, last in zip(VISITED_FIRST, VISITED_LAST)
+        )
+        for level in range(GRADIENT_LEVELS)
+    ],
+    dtype=np.uint8,
+)
+
+
+def plot_indices(grid: Grid, points: Sequence[Tuple[int, int]]) -> np.ndarray:
+    """Grid indices of points in plot coordinates, e.g. the paths of MazeSolver"""
+    points = np.asarray(points, dtype=np.intp).reshape(-1, 2)
+    return (grid.width - points[:, 1]) * grid.length + points[:, 0] - 1
+
+
+def visit_colours(count: int, start: int = 0, total: int = None) -> np.ndarray:
+    """Gradient colours of the visited cells start to start + count of total"""
+    total = count if total is None else total
+    levels = np.arange(start, start + count) * (GRADIENT_LEVELS - 1)
+    return (VISITED + levels // max(1, total - 1)).astype(np.uint8)
+
+
+def cell_colours(
+    grid: Grid, solution_path: Sequence[int] = (), visit_order: Sequence[int] = ()
+) -> np.ndarray:
+    """Palette index of every cell as a (width, length) array. Paths are grid
+    indices, the solution path is painted above the visited cells and the
+    starting and ending point above both."""
+    values = np.frombuffer(grid.values, dtype=np.uint8)
+    colours = values.copy()
+    visit_order = np.asarray(visit_order, dtype=np.intp)
+    colours[visit_order] = visit_colours(len(visit_order))
+    colours[np.asarray(solution_path, dtype=np.intp)] = PATH
+    points = values >= 2
+    colours[points] = values[points]
+    return colours.reshape(grid.width, grid.length)
+
+
+def scale(cells: np.ndarray, cell_size: int) -> np.ndarray:
+    """Every cell becomes a square of cell_size x cell_size pixels"""
+    width, length = cells.shape
+    pixels = np.broadcast_to(
+        cells[:, None, :, None], (width, cell_size, length, cell_size)
+    )
+    return pixels.reshape(width * cell_size, length * cell_size)
+
+
+def render_maze(
+    grid: Grid,
+    cell_size: int = 4,
+    solution_path: Sequence[int] = (),
+    visit_order: Sequence[int] = (),
+) -> np.ndarray:
+    """RGB image of the maze with cell_size pixels per cell"""
+    return PALETTE[scale(cell_colours(grid, solution_path, visit_order), cell_size)]
+
+
+def palette_image(pixels: np.ndarray) -> Image.Image:
+    image = Image.frombytes("P", pixels.shape[::-1], pixels.tobytes())
+    image.putpalette(PALETTE.tobytes())
+    return image
+
+
+def write_png(
+    filename: str,
+    grid: Grid,
+    cell_size: int = 4,
+    solution_path: Sequence[int] = (),
+    visit_order: Sequence[int] = (),
+    compress_level: int = 1,
+) -> None:
+    """Writes the maze as PNG with a palette, one byte per pixel. Large mazes
+    spend most of the time compressing, compress_level 1 favours speed."""
+    pixels = scale(cell_colours(grid, solution_path, visit_order), cell_size)
+    palette_image(pixels).save(filename, compress_level=compress_level)
+
+
+def path_frames(
+    grid: Grid,
+    path: Sequence[int],
+    cell_size: int = 4,
+    frames: int = 100,
+    solution_path: Sequence[int] = (),
+) -> Iterator[np.ndarray]:
+    """Palette images of the maze while path (grid indices in visiting order) is
+    painted in frames batches, solution_path is added in an extra last frame.
+
+    One image is painted in place, so every yielded frame is only valid until
+    the next one is requested."""
+    values = np.frombuffer(grid.values, dtype=np.uint8)
+    pixels = np.ascontiguousarray(
+        scale(values.reshape(grid.width, grid.length), cell_size)
+    )
+    # the pixels of cell (row, column) are blocks[row, :, column, :]
+    blocks = pixels.reshape(grid.width, cell_size, grid.length, cell_size)
+    path = np.asarray(path, dtype=np.intp)
+    path = path[values[path] < 2]
+    step = max(1, -(-len(path) // max(1, frames)))
+    yield pixels
+    for start in range(0, len(path), step):
+        batch = path[start : start + step]
+        rows, columns = np.divmod(batch, grid.length)
+        colours = visit_colours(len(batch), start, len(path))
+        blocks[rows, :, columns, :] = colours[:, None, None]
+        yield pixels
+    if len(solution_path):
+        solution_path = np.asarray(solution_path, dtype=np.intp)
+        solution_path = solution_path[values[solution_path] < 2]
+        rows, columns = np.divmod(solution_path, grid.length)
+        blocks[rows, :, columns, :] = PATH
+        yield pixels
+
+
+def write_frames(
+    directory: str,
+    grid: Grid,
+    path: Sequence[int],
+    cell_size: int = 4,
+    frames: int = 100,
+    solution_path: Sequence[int] = (),
+    compress_level: int = 1,
+) -> List[str]:
+    """Writes the frames of path_frames as numbered PNG files to directory"""
+    os.makedirs(directory, exist_ok=True)
+    filenames = []
+    for number, pixels in enumerate(
+        path_frames(grid, path, cell_size, frames, solution_path)
+    ):
+        filename = os.path.join(directory, f"frame_{number:05d}.png")
+        palette_image(pixels).save(filename, compress_level=compress_level)
+        filenames.append(filename)
+    return filenames
+
+
+def write_gif(
+    filename: str,
+    grid: Grid,
+    path: Sequence[int],
+    cell_size: int = 4,
+    frames: int = 100,
+    solution_path: Sequence[int] = (),
+    duration: int = 40,
+) -> None:
+    """Writes the frames of path_frames as animated GIF, duration milliseconds
+    per frame"""
+    images = [
+        palette_image(pixels)
+        for pixels in path_frames(grid, path, cell_size, frames, solution_path)
+    ]
+    images[0].save(
+        filename,
+        save_all=True,
+        append_images=images[1:],
+        duration=duration,
+        loop=0,
+    )
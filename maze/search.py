@@ -0,0 +1,196 @@
+from array import array
+from collections import deque
+from heapq import heappush, heappop
+from itertools import count
+from typing import Dict, List, Tuple
+from maze.grid import Grid
+
+UNVISITED = -1
+
+
+def breadth_first_search(
+    grid: Grid, source: int, target: int = UNVISITED
+) -> Tuple[array, array]:
+    """Breadth first search over the grid indices starting at source.
+
+    Returns the parent index of every cell (UNVISITED if it was not reached,
+    source is its own parent) and the indices in the order they were visited.
+    The search stops as soon as target is reached."""
+    parents = array("l", [UNVISITED]) * grid.size
+    parents[source] = source
+    order = array("l", [source])
+    if source == target:
+        return parents, order
+    neighbours = grid.neighbours
+    frontier = deque([source])
+    while frontier:
+        current = frontier.popleft()
+        for neighbour in neighbours(current):
+            if parents[neighbour] == UNVISITED:
+                parents[neighbour] = current
+                order.append(neighbour)
+                if neighbour == target:
+                    return parents, order
+                frontier.append(neighbour)
+    return parents, order
+
+
+def breadth_first_distances(grid: Grid, source: int) -> array:
+    """Number of steps from source to every cell in one breadth first sweep,
+    level by level over a flat frontier list. Walls and cells which cannot be
+    reached keep UNVISITED (-1)."""
+    distances = array("i", [UNVISITED]) * grid.size
+    distances[source] = 0
+    masks = grid.masks
+    deltas = grid.deltas
+    frontier = [source]
+    distance = 0
+    while frontier:
+        distance += 1
+        next_frontier = []
+        for current in frontier:
+            for delta in deltas[masks[current]]:
+                neighbour = current + delta
+                if distances[neighbour] == UNVISITED:
+                    distances[neighbour] = distance
+                    next_frontier.append(neighbour)
+        frontier = next_frontier
+    return distances
+
+
+def best_first_search(
+    grid: Grid, source: int, target: int, cost_weight: int = 1
+) -> Tuple[array, array]:
+    """Best first search towards target ordered by cost_weight * steps taken plus
+    the manhattan distance to target: A* for cost_weight 1, greedy best first
+    search for cost_weight 0. Ties are broken towards the cell closer to target
+    and then in insertion order.
+
+    Returns the parent index of every reached cell (UNVISITED otherwise) and the
+    indices in the order they were expanded."""
+    length = grid.length
+    target_row, target_column = divmod(target, length)
+    parents = array("l", [UNVISITED]) * grid.size
+    parents[source] = source
+    costs = array("l", [0]) * grid.size
+    expanded = bytearray(grid.size)
+    order = array("l")
+    neighbours = grid.neighbours
+    tie = count()
+    row, column = divmod(source, length)
+    distance = abs(row - target_row) + abs(column - target_column)
+    heap = [(distance, distance, next(tie), source)]
+    while heap:
+        current = heappop(heap)[3]
+        if expanded[current]:
+            continue
+        expanded[current] = 1
+        order.append(current)
+        if current == target:
+            break
+        cost = costs[current] + 1
+        for neighbour in neighbours(current):
+            if expanded[neighbour]:
+                continue
+            if parents[neighbour] == UNVISITED or cost < costs[neighbour]:
+                parents[neighbour] = current
+                costs[neighbour] = cost
+                row, column = divmod(neighbour, length)
+                distance = abs(row - target_row) + abs(column - target_column)
+                heappush(
+                    heap,
+                    (cost_weight * cost + distance, distance, next(tie), neighbour),
+                )
+    return parents, order
+
+
+def bidirectional_search(
+    grid: Grid, source: int, target: int
+) -> Tuple[array, array, int, array]:
+    """Breadth first search from source and target at the same time, always
+    expanding one level of the smaller frontier. The level in which the two
+    searches meet is completed and the meeting point with the shortest path
+    is chosen.
+
+    Returns the parent indices of the search from source and of the search
+    from target, the meeting point (UNVISITED if there is none) and the indices
+    in the order they were visited by either search."""
+    forward = array("l", [UNVISITED]) * grid.size
+    backward = array("l", [UNVISITED]) * grid.size
+    forward[source] = source
+    backward[target] = target
+    order = array("l", [source])
+    if source == target:
+        return forward, backward, source, order
+    order.append(target)
+    neighbours = grid.neighbours
+    frontiers = [[source], [target]]
+    searches = [forward, backward]
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        parents, other = searches[side], searches[1 - side]
+        candidates = []
+        next_frontier = []
+        for current in frontiers[side]:
+            for neighbour in neighbours(current):
+                if parents[neighbour] == UNVISITED:
+                    parents[neighbour] = current
+                    order.append(neighbour)
+                    if other[neighbour] != UNVISITED:
+                        candidates.append(neighbour)
+                    next_frontier.append(neighbour)
+        if candidates:
+            meeting = min(candidates, key=lambda index: depth(other, index))
+            return forward, backward, meeting, order
+        frontiers[side] = next_frontier
+    return forward, backward, UNVISITED, order
+
+
+def depth(parents: array, index: int) -> int:
+    """Number of steps from index up to the source of the search"""
+    steps = 0
+    while parents[index] != index:
+        index = parents[index]
+        steps += 1
+    return steps
+
+
+def reconstruct_path(parents: array, target: int) -> List[int]:
+    """Walks up the parent indices from target to the source of the search"""
+    if parents[target] == UNVISITED:
+        return []
+    path = [target]
+    while parents[target] != target:
+        target = parents[target]
+        path.append(target)
+    path.reverse()
+    return path
+
+
+def branch_paths(
+    parents: array, order: array, target: int = UNVISITED
+) -> Dict[str, List[int]]:
+    """Splits a search tree into branches keyed like "1", "1.2", "1.2.1", ...
+
+    A branch continues as long as a cell has exactly one child, the children
+    of a split are numbered from 1 on. The target always extends the branch
+    of its parent."""
+    child_count: Dict[int, int] = {}
+    for index in order[1:]:
+        parent = parents[index]
+        child_count[parent] = child_count.get(parent, 0) + 1
+    source = order[0]
+    keys = {source: "1"}
+    dict_path = {"1": [source]}
+    child_number: Dict[int, int] = {}
+    for index in order[1:]:
+        parent = parents[index]
+        child_number[parent] = child_number.get(parent, 0) + 1
+        if child_count[parent] == 1 or index == target:
+            key = keys[parent]
+            dict_path[key].append(index)
+        else:
+            key = keys[parent] + "." + str(child_number[parent])
+            dict_path[key] = [index]
+        keys[index] = key
+    return dict_path
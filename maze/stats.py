@@ -0,0 +1,124 @@
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+from maze.search import UNVISITED
+
+# hook(event, stats) is called after every phase with the name of the phase
+Hook = Callable[[str, "SolveStats"], None]
+
+NO_PHASE = nullcontext()
+
+
+class SolveStats:
+    """Measurements of loading and solving a maze.
+
+    Nothing is measured unless a SolveStats is handed to Maze, Maze.import_maze
+    or MazeSolver: the searches themselves are not instrumented, their counters
+    are derived from the search results afterwards. Counters an algorithm
+    cannot provide stay None."""
+
+    def __init__(self, track_memory: bool = False, hooks: Iterable[Hook] = ()):
+        # tracemalloc slows down python considerably, so it is opt-in
+        self.track_memory = track_memory
+        self.hooks: List[Hook] = list(hooks)
+        # seconds per phase: import, validate, index build, solve,
+        # path reconstruction
+        self.phases: Dict[str, float] = {}
+        self.cells_expanded: Optional[int] = None
+        self.peak_frontier: Optional[int] = None
+        # expanded cells with more than one child in the search
+        self.branches: Optional[int] = None
+        # bytes, only with track_memory
+        self.peak_memory: Optional[int] = None
+
+    @contextmanager
+    def phase(self, name: str):
+        tracing = self.track_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        elif self.track_memory and hasattr(tracemalloc, "reset_peak"):
+            # python < 3.9 cannot reset the peak, which then counts from the
+            # start of the tracing
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (
+                time.perf_counter() - start
+            )
+            if self.track_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                self.peak_memory = max(self.peak_memory or 0, peak)
+            if tracing:
+                tracemalloc.stop()
+            for hook in self.hooks:
+                hook(name, self)
+
+    def record_search(
+        self,
+        parents: Union[Sequence[int], Mapping[int, int]],
+        order: Iterable[int],
+    ):
+        """Counters of a search given the parent of every reached cell (UNVISITED
+        or the cell itself for none) and the cells in the order they were
+        expanded. The frontier after each expansion is every cell reached so
+        far minus the expanded ones."""
+        if isinstance(parents, Mapping):
+            items = parents.items()
+        else:
+            items = enumerate(parents)
+        children: Dict[int, int] = {}
+        for index, parent in items:
+            if parent != UNVISITED and parent != index:
+                children[parent] = children.get(parent, 0) + 1
+        reached = 1
+        peak = 1
+        expanded = 0
+        branches = 0
+        for index in order:
+            expanded += 1
+            count = children.get(index, 0)
+            if count > 1:
+                branches += 1
+            reached += count
+            peak = max(peak, reached - expanded)
+        self.cells_expanded = (self.cells_expanded or 0) + expanded
+        self.peak_frontier = max(self.peak_frontier or 0, peak)
+        self.branches = (self.branches or 0) + branches
+
+    def record_walk(self, walk: Iterable[int]):
+        """Counters of a depth first search from its walk: new cells are pushed
+        onto the stack of the previous point, a repeated point is a step back to
+        a cell which branches out again"""
+        depths: Dict[int, int] = {}
+        peak = 0
+        branches = set()
+        previous = None
+        for index in walk:
+            if index in depths:
+                branches.add(index)
+            else:
+                depths[index] = depths[previous] + 1 if previous is not None else 1
+                peak = max(peak, depths[index])
+            previous = index
+        self.cells_expanded = (self.cells_expanded or 0) + len(depths)
+        self.peak_frontier = max(self.peak_frontier or 0, peak)
+        self.branches = (self.branches or 0) + len(branches)
+
+    def as_dict(self) -> dict:
+        return {
+            "phases": dict(self.phases),
+            "cells_expanded": self.cells_expanded,
+            "peak_frontier": self.peak_frontier,
+            "branches": self.branches,
+            "peak_memory": self.peak_memory,
+        }
+
+
+def phase(stats: Optional[SolveStats], name: str):
+    """stats.phase(name), or a context doing nothing if stats is None"""
+    if stats is None:
+        return NO_PHASE
+    return stats.phase(name)
@@ -0,0 +1,15 @@
+import pytest
+from maze.maze import Maze
+
+
+@pytest.fixture
+def example_maze():
+    return Maze.import_maze("tests/maze_examples/maze_12_6.txt")
+
+
+@pytest.fixture
+def small_grid():
+    # 2 1 1
+    # 1 0 1
+    # 1 0 3
+    return Maze([[2, 1, 1], [1, 0, 1], [1, 0, 3]]).grid
@@ -0,0 +1,77 @@
+import pytest
+from maze.maze import Maze
+from maze.algorithm import BFSAlgorithm, DFSAlgorithm, NotSolvable
+from maze.batch import solve_many, generate_many
+from maze.maze_factory import DFSMaze
+from maze.maze_utils import transform_indices
+
+
+@pytest.fixture
+def example_mazes():
+    return [
+        "tests/maze_examples/maze_12_6.txt",
+        "tests/maze_examples/maze_fail.txt",
+        Maze([[2, 0, 3], [1, 0, 1]]),
+        Maze.import_maze("tests/maze_examples/maze_6_3.txt"),
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_solve_many(example_mazes, workers):
+    results = solve_many(example_mazes, BFSAlgorithm, workers=workers)
+    assert [result.source for result in results] == [
+        "tests/maze_examples/maze_12_6.txt",
+        "tests/maze_examples/maze_fail.txt",
+        2,
+        3,
+    ]
+    assert [result.solved for result in results] == [True, False, False, True]
+    assert isinstance(results[1].error, TypeError)
+    assert isinstance(results[2].error, NotSolvable)
+
+
+def test_solve_many_paths(example_mazes):
+    maze = example_mazes[3]
+    result = solve_many([maze], DFSAlgorithm)[0]
+    expected = BFSAlgorithm.solve(maze)[0]
+    assert transform_indices(result.solution_path, maze.grid) == expected
+    assert result.visited >= len(expected)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generate_many(tmp_path, workers):
+    sizes = [(4, 6), (5, 5), (4, 6)]
+    filenames = generate_many(
+        DFSMaze, sizes, [1, 2, 1], directory=str(tmp_path), workers=workers
+    )
+    assert filenames[0].endswith("dfsmaze_4_6_1.maze")
+    mazes = [Maze.import_maze(filename) for filename in filenames]
+    assert [(maze.width, maze.length) for maze in mazes] == [(7, 11), (9, 9), (7, 11)]
+    assert filenames[2] == filenames[0]
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "dfsmaze_4_6_1.maze",
+        "dfsmaze_5_5_2.maze",
+    ]
+
+
+def test_generate_many_duplicates_once(tmp_path, monkeypatch):
+    generated = []
+    monkeypatch.setattr(
+        "maze.batch.generate_item", lambda item: generated.append(item[-1])
+    )
+    filenames = generate_many(
+        DFSMaze, [(4, 6), (4, 6), (4, 6)], [1, 1, 2], directory=str(tmp_path), workers=1
+    )
+    assert filenames[0] == filenames[1] != filenames[2]
+    assert generated == [filenames[0], filenames[2]]
+
+
+def test_generate_many_creates_directory(tmp_path):
+    directory = tmp_path / "new" / "mazes"
+    filenames = generate_many(DFSMaze, [(4, 6)], [1], directory=str(directory))
+    assert Maze.import_maze(filenames[0]).width == 7
+
+
+def test_generate_many_seeds():
+    with pytest.raises(ValueError):
+        generate_many(DFSMaze, [(4, 6)], [1, 2])
@@ -0,0 +1,29 @@
+import json
+import os
+import subprocess
+import sys
+
+SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "benchmarks",
+    "maze_benchmark.py",
+)
+
+
+def test_maze_benchmark(tmp_path):
+    output = tmp_path / "bench.json"
+    subprocess.run(
+        [sys.executable, SCRIPT, "--sizes", "3", "--output", str(output)],
+        cwd=tmp_path,
+        capture_output=True,
+        check=True,
+    )
+    report = json.loads(output.read_text())
+    assert len(report["results"]) == 4
+    for result in report["results"]:
+        assert result["grid"] == [5, 5]
+        assert {"generate", "Maze.__init__", "import txt", "import maze"} <= set(
+            result["steps"]
+        )
+        lengths = {stats["solution_length"] for stats in result["algorithms"].values()}
+        assert len(result["algorithms"]) == 7 and len(lengths) == 1
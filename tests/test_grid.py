@@ -0,0 +1,60 @@
+import pytest
+from maze.grid import Grid, CellConfig, UP, DOWN, RIGHT, LEFT
+from maze.maze import Maze
+
+
+@pytest.fixture
+def example_config():
+    return [[2, 1, 0], [0, 1, 0], [1, 1, 3]]
+
+
+@pytest.fixture
+def example_grid(example_config):
+    return Maze(example_config).grid
+
+
+def test_grid_index_coords(example_grid):
+    assert all(
+        example_grid.coords(example_grid.index(x, y)) == (x, y)
+        for x in range(1, 4)
+        for y in range(1, 4)
+    )
+
+
+def test_grid_masks(example_grid):
+    assert example_grid.masks[example_grid.index(1, 1)] == RIGHT
+    assert example_grid.masks[example_grid.index(2, 2)] == UP | DOWN
+    assert example_grid.masks[example_grid.index(3, 2)] == UP | RIGHT | LEFT
+    assert example_grid.masks[example_grid.index(1, 3)] == 0
+
+
+@pytest.mark.parametrize("x, y, value", [(2, 1, 1), (2, 2, 0), (1, 3, 1)])
+def test_grid_set_value(example_grid, x, y, value):
+    example_grid.set_value(example_grid.index(x, y), value)
+    masks = bytearray(example_grid.masks)
+    example_grid.init_masks()
+    assert masks == example_grid.masks
+
+
+def test_grid_neighbour_dict(example_grid):
+    assert example_grid.neighbour_dict(1, 2) == {"down": (2, 2), "left": (1, 1)}
+
+
+def test_grid_wrong_size():
+    with pytest.raises(ValueError):
+        Grid(2, 2, bytearray(3))
+
+
+def test_cell_config_lazy(example_grid):
+    cell_config = CellConfig(example_grid, Maze.valid_values)
+    assert not cell_config._cells
+    assert cell_config[(3, 3)]._typing == "E"
+    assert list(cell_config._cells) == [(3, 3)]
+
+
+def test_cell_config_keys(example_grid):
+    cell_config = CellConfig(example_grid, Maze.valid_values)
+    assert len(cell_config) == 9
+    assert (3, 3) in cell_config and (4, 1) not in cell_config
+    with pytest.raises(KeyError):
+        cell_config[(0, 1)]
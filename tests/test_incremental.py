@@ -0,0 +1,27 @@
+from maze.incremental import INFINITY, LifelongAStar
+
+
+def test_lifelong_a_star(small_grid):
+    planner = LifelongAStar(small_grid, 0, 8)
+    planner.compute_shortest_path()
+    assert planner.path() == [0, 1, 2, 5, 8]
+
+
+def test_lifelong_a_star_no_changes(small_grid):
+    planner = LifelongAStar(small_grid, 0, 8)
+    planner.compute_shortest_path()
+    assert planner.compute_shortest_path() == []
+    assert planner.last_expanded
+
+
+def test_lifelong_a_star_update_cell(small_grid):
+    planner = LifelongAStar(small_grid, 0, 8)
+    planner.compute_shortest_path()
+    small_grid.set_value(5, 0)
+    planner.update_cell(5)
+    planner.compute_shortest_path()
+    assert planner.path() == [] and planner.g[8] == INFINITY
+    small_grid.set_value(7, 1)
+    planner.update_cell(7)
+    planner.compute_shortest_path()
+    assert planner.path() == [0, 3, 6, 7, 8]
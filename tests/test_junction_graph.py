@@ -0,0 +1,34 @@
+from maze.algorithm import BFSAlgorithm, JunctionGraphAlgorithm
+
+
+def test_junction_graph_nodes(example_maze):
+    graph = example_maze.junction_graph()
+    grid = example_maze.grid
+    assert grid.index(*example_maze.starting_point) in graph.adjacency
+    assert grid.index(*example_maze.ending_point) in graph.adjacency
+    assert len(graph.adjacency) < sum(1 for value in grid.values if value)
+
+
+def test_junction_graph_covers_cells(example_maze):
+    # every open cell is either a node or on exactly one corridor
+    graph = example_maze.junction_graph()
+    cells = list(graph.adjacency)
+    for _, _, run in graph.edges:
+        cells += run
+    open_cells = [
+        index for index, value in enumerate(example_maze.grid.values) if value
+    ]
+    assert sorted(cells) == open_cells
+
+
+def test_junction_graph_cached(example_maze):
+    graph = example_maze.junction_graph()
+    assert example_maze.junction_graph() is graph
+    example_maze.config = example_maze.config
+    assert example_maze.junction_graph() is not graph
+
+
+def test_junction_graph_algorithm(example_maze):
+    solution_path, full_path = JunctionGraphAlgorithm.solve(example_maze)
+    assert solution_path == BFSAlgorithm.solve(example_maze)[0]
+    assert set(solution_path) <= set(full_path)
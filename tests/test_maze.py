@@ -1,17 +1,30 @@
+import logging
+import os
+import subprocess
+import sys
 from maze.maze import (
     Maze,
     InvalidList,
+    configure_logging,
+    logger,
+)
+from maze.maze_utils import find_value_in_config, transform_coordinates
+from maze.algorithm import (
+    DFSAlgorithm,
+    BFSAlgorithm,
+    AStarAlgorithm,
+    GreedyBestFirstAlgorithm,
+    BidirectionalBFSAlgorithm,
+    JunctionGraphAlgorithm,
+    LifelongAStarAlgorithm,
+    MazeSolver,
+    NotSolvable,
+    frame_ends,
+    frame_interval,
 )
-from maze.maze_utils import find_value_in_config
-from maze.algorithm import DFSAlgorithm, MazeSolver
 import pytest
 
 
-@pytest.fixture
-def example_maze():
-    return Maze.import_maze("tests/maze_examples/maze_12_6.txt")
-
-
 @pytest.fixture
 def example_sample_full_path():
     return [
@@ -104,6 +117,20 @@ def test_validate_values(example_maze, example_fail_values_list):
         example_maze.validate_input(example_fail_values_list)
 
 
+def test_validate_input_ragged(example_maze):
+    with pytest.raises(InvalidList):
+        example_maze.validate_input([[0, 2, 1], [1, 3]])
+
+
+@pytest.mark.parametrize(
+    "maze_config",
+    [[[2, 1, 2], [0, 1, 3]], [[2, 1, 3], [0, 1, 3]], [[2, 1, 1], [1, 1, 3]]],
+)
+def test_validate_values_count(maze_config):
+    with pytest.raises(InvalidList):
+        Maze(maze_config)
+
+
 def test_config_cells_starting_point(example_maze):
     assert example_maze.starting_point == (2, 9)
 
@@ -118,6 +145,227 @@ def test_maze_solver_dfs(example_maze, solution_path):
     assert maze_solver.solution_path == solution_path
 
 
+def test_maze_solver_dfs_full_path(example_maze, solution_path):
+    maze_solver = MazeSolver(example_maze, DFSAlgorithm)
+    maze_solver.solve_maze()
+    full_path = maze_solver.full_path
+    assert full_path[0] == solution_path[0] and full_path[-1] == solution_path[-1]
+    assert set(solution_path) <= set(full_path)
+
+
+def test_maze_solver_bfs(example_maze, solution_path):
+    maze_solver = MazeSolver(example_maze, BFSAlgorithm)
+    maze_solver.solve_maze()
+    assert maze_solver.solution_path == solution_path
+
+
+def test_maze_solver_bfs_repeated(example_maze, solution_path):
+    neighbours = dict(example_maze.cell_config[example_maze.ending_point]._neighbours)
+    first = BFSAlgorithm.solve(example_maze)
+    second = BFSAlgorithm.solve(example_maze)
+    assert first == second and first[0] == solution_path
+    assert example_maze.cell_config[example_maze.ending_point]._neighbours == neighbours
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [
+        AStarAlgorithm,
+        GreedyBestFirstAlgorithm,
+        BidirectionalBFSAlgorithm,
+        LifelongAStarAlgorithm,
+    ],
+)
+def test_maze_solver_heuristic(example_maze, solution_path, algorithm):
+    maze_solver = MazeSolver(example_maze, algorithm)
+    maze_solver.solve_maze()
+    assert maze_solver.solution_path == solution_path
+    assert set(solution_path) <= set(maze_solver.full_path)
+
+
+def test_maze_solver_a_star_expansions(example_maze):
+    _, bfs_full_path = BFSAlgorithm.solve(example_maze)
+    _, a_star_full_path = AStarAlgorithm.solve(example_maze)
+    assert len(a_star_full_path) <= sum(len(path) for path in bfs_full_path.values())
+
+
+@pytest.mark.parametrize(
+    "algorithm",
+    [
+        DFSAlgorithm,
+        BFSAlgorithm,
+        AStarAlgorithm,
+        GreedyBestFirstAlgorithm,
+        BidirectionalBFSAlgorithm,
+        JunctionGraphAlgorithm,
+        LifelongAStarAlgorithm,
+    ],
+)
+def test_maze_solver_not_solvable(algorithm):
+    maze_solver = MazeSolver(Maze([[2, 0, 3], [1, 0, 1]]), algorithm)
+    with pytest.raises(NotSolvable):
+        maze_solver.solve_maze()
+
+
+def test_distance_field(example_maze, solution_path):
+    distances = example_maze.distance_field()
+    grid = example_maze.grid
+    assert len(distances) == grid.size
+    assert distances[grid.index(*example_maze.starting_point)] == 0
+    assert distances[grid.index(*example_maze.ending_point)] == len(solution_path) - 1
+    assert all(
+        distance == -1 for distance, value in zip(distances, grid.values) if not value
+    )
+
+
+def test_distance_field_unreachable():
+    distances = Maze([[2, 0, 3], [1, 0, 1]]).distance_field((2, 3))
+    assert list(distances) == [-1, -1, 1, -1, -1, 0]
+
+
+def test_distance_field_wall(example_maze):
+    with pytest.raises(ValueError):
+        example_maze.distance_field((0, 1))
+
+
+def test_shortest_path(example_maze):
+    path = example_maze.shortest_path(
+        example_maze.starting_point, example_maze.ending_point
+    )
+    solution_path = BFSAlgorithm.solve(example_maze)[0]
+    assert transform_coordinates(path, example_maze.width) == solution_path
+
+
+def test_shortest_path_cached_end(example_maze):
+    start, end = example_maze.starting_point, example_maze.ending_point
+    path = example_maze.shortest_path(start, end)
+    assert example_maze.shortest_path(end, start) == path[::-1]
+    assert len(example_maze._search_trees) == 1
+
+
+def test_shortest_path_cache_size(example_maze):
+    example_maze.search_tree_cache_size = 2
+    cells = [(1, 1), (1, 2), (1, 3)]
+    for cell in cells:
+        example_maze.shortest_path(cell, example_maze.ending_point)
+    assert len(example_maze._search_trees) == 2
+
+
+def test_shortest_path_unreachable():
+    assert Maze([[2, 0, 3], [1, 0, 1]]).shortest_path((1, 1), (1, 3)) == []
+
+
+def test_shortest_paths(example_maze):
+    start, end = example_maze.starting_point, example_maze.ending_point
+    pairs = [(start, end), (end, start), (start, start), (start, (1, 1))]
+    paths = example_maze.shortest_paths(pairs)
+    assert paths == [example_maze.shortest_path(*pair) for pair in pairs]
+    assert paths[2] == [start]
+
+
+def test_set_cell(example_maze):
+    example_maze.set_cell(1, 8, 1)
+    assert example_maze.config[0][7] == 1
+    assert example_maze.grid.neighbour_dict(1, 7)["right"] == (1, 8)
+    assert example_maze.cell_config[(1, 7)]._neighbours["right"] == (1, 8)
+
+
+def test_set_cell_starting_point(example_maze):
+    example_maze.set_cell(1, 1, 2)
+    assert example_maze.starting_point == (1, 1)
+    assert example_maze.config[1][8] == 1
+
+
+@pytest.mark.parametrize("x, y, value", [(2, 9, 0), (5, 6, 1), (1, 1, 4)])
+def test_set_cell_invalid(example_maze, x, y, value):
+    with pytest.raises(InvalidList):
+        example_maze.set_cell(x, y, value)
+
+
+def test_set_cell_resolve(example_maze, solution_path):
+    _, full_path = LifelongAStarAlgorithm.solve(example_maze)
+    # opening the wall creates a shortcut
+    example_maze.set_cell(3, 6, 1)
+    path, repaired = LifelongAStarAlgorithm.solve(example_maze)
+    assert path == BFSAlgorithm.solve(example_maze)[0]
+    assert len(path) < len(solution_path) and len(repaired) < len(full_path)
+    example_maze.set_cell(3, 6, 0)
+    assert LifelongAStarAlgorithm.solve(example_maze)[0] == solution_path
+
+
+def test_resolve_without_changes(example_maze):
+    first_solver = MazeSolver(example_maze, LifelongAStarAlgorithm)
+    first_solver.solve_maze()
+    maze_solver = MazeSolver(example_maze, LifelongAStarAlgorithm)
+    maze_solver.solve_maze()
+    assert maze_solver.full_path == first_solver.full_path
+    plot_dict = maze_solver.plot_dict("full")
+    assert len(plot_dict) == len(set(maze_solver.full_path))
+
+
+def test_import_without_side_effects(tmp_path):
+    code = "import sys, maze.batch; print('matplotlib' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": os.getcwd()},
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout.strip() == "False"
+    assert not list(tmp_path.iterdir())
+
+
+def test_configure_logging(example_maze, tmp_path):
+    filename = tmp_path / "maze.log"
+    handler = configure_logging(str(filename))
+    try:
+        MazeSolver(example_maze, BFSAlgorithm).solve_maze()
+        MazeSolver(example_maze, DFSAlgorithm).solve_maze()
+        handler.flush()
+        log = filename.read_text()
+        assert "BFSAlgorithm visited" in log
+        assert "Next Point" in log
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
+        handler.close()
+
+
+def test_frame_ends():
+    assert list(frame_ends(10, 0.05, 30)) == list(range(1, 11))
+    assert list(frame_ends(10, 0.01, 30)) == [3, 6, 9, 12]
+    assert list(frame_ends(10, 0, 30)) == [10]
+
+
+def test_frame_interval():
+    assert frame_interval(10, 0.05, 30) == pytest.approx(50)
+    assert frame_interval(10, 1.0, 30) == pytest.approx(1000)
+    # three points per frame at 30 frames per second
+    assert frame_interval(10, 0.01, 30) == pytest.approx(1000 / 30)
+    assert frame_interval(10, 0, 30) == pytest.approx(1000 / 30)
+
+
+def test_path_animation(example_maze, tmp_path):
+    matplotlib = pytest.importorskip("matplotlib")
+    matplotlib.use("Agg")
+    from matplotlib import pyplot as plt
+
+    maze_solver = MazeSolver(example_maze, BFSAlgorithm)
+    maze_solver.solve_maze()
+    plot_dict = maze_solver.plot_dict("full")
+    fig, ax = plt.subplots()
+    animation = maze_solver.path_animation(ax, plot_dict, pausing=0.01)
+    animation.save(str(tmp_path / "path.gif"), writer="pillow")
+    # a single artist holds every point
+    assert len(ax.collections) == 1
+    assert len(ax.collections[0].get_offsets()) == len(plot_dict)
+    assert animation._interval == pytest.approx(1000 / 30)
+    animation = maze_solver.path_animation(ax, plot_dict, pausing=0.5)
+    assert animation._interval == pytest.approx(500)
+    plt.close(fig)
+
+
 def test_import_maze(example_maze):
     with pytest.raises(TypeError):
         example_maze.import_maze("tests/maze_examples/maze_fail.txt")
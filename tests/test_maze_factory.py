@@ -0,0 +1,87 @@
+import random
+import pytest
+from maze.maze import Maze
+from maze.maze_factory import DFSMaze, EllerMaze, KruskalMaze, WilsonMaze
+from maze.search import breadth_first_search
+
+WIDTH = 8
+LENGTH = 13
+FACTORIES = [DFSMaze, KruskalMaze, WilsonMaze, EllerMaze]
+
+
+@pytest.fixture(params=FACTORIES)
+def created_maze(request):
+    maze_generator = request.param(WIDTH, LENGTH)
+    maze_generator.create_maze()
+    return maze_generator
+
+
+def test_maze_size(created_maze):
+    maze_list = created_maze.maze
+    assert len(maze_list) == 2 * WIDTH - 1
+    assert all(len(line) == 2 * LENGTH - 1 for line in maze_list)
+
+
+def test_maze_values(created_maze):
+    values = [value for line in created_maze.maze for value in line]
+    assert values.count(2) == 1 and values.count(3) == 1
+    assert set(values) == {0, 1, 2, 3}
+
+
+def test_maze_perfect(created_maze):
+    # a spanning tree over all cells has exactly one passage less than cells
+    maze = Maze(created_maze.maze)
+    open_cells = sum(1 for value in maze.grid.values if value)
+    assert open_cells == 2 * WIDTH * LENGTH - 1
+    _, order = breadth_first_search(maze.grid, maze.grid.values.index(2))
+    assert len(order) == open_cells
+
+
+def test_maze_export(created_maze, tmp_path):
+    filename = str(tmp_path / "maze.txt")
+    created_maze.export_maze(filename)
+    assert Maze.import_maze(filename).config == created_maze.maze
+
+
+@pytest.mark.parametrize("factory", FACTORIES)
+def test_maze_not_created(factory):
+    with pytest.raises(ValueError):
+        factory(WIDTH, LENGTH).maze
+
+
+@pytest.mark.parametrize("factory", FACTORIES)
+def test_maze_seed(factory):
+    mazes = [factory(WIDTH, LENGTH, seed=7) for _ in range(2)]
+    for maze_generator in mazes:
+        maze_generator.create_maze()
+    assert mazes[0].maze == mazes[1].maze
+
+
+def test_dfs_maze_random_instance():
+    maze_generator = DFSMaze(WIDTH, LENGTH, seed=random.Random(7))
+    maze_generator.create_maze()
+    seeded_generator = DFSMaze(WIDTH, LENGTH, seed=7)
+    seeded_generator.create_maze()
+    assert maze_generator.maze == seeded_generator.maze
+
+
+@pytest.mark.parametrize("factory", FACTORIES)
+def test_maze_too_small(factory):
+    with pytest.raises(ValueError):
+        factory(1, 1).create_maze()
+
+
+def test_eller_maze_rows():
+    rows = list(EllerMaze(WIDTH, LENGTH, seed=3).rows())
+    assert len(rows) == 2 * WIDTH - 1
+    assert all(len(row) == 2 * LENGTH - 1 for row in rows)
+    assert 2 in rows[0] and 3 in rows[-1]
+
+
+@pytest.mark.parametrize("ending", ["txt", "maze"])
+def test_eller_maze_stream(tmp_path, ending):
+    filename = str(tmp_path / f"maze.{ending}")
+    EllerMaze(WIDTH, LENGTH, seed=3).stream_maze(filename)
+    maze_generator = EllerMaze(WIDTH, LENGTH, seed=3)
+    maze_generator.create_maze()
+    assert Maze.import_maze(filename).config == maze_generator.maze
@@ -0,0 +1,115 @@
+import pytest
+from maze.maze import Maze, InvalidList
+from maze.maze_io import (
+    HEADER,
+    MappedGrid,
+    pack_values,
+    unpack_values,
+    read_header,
+    decode_row,
+    read_text,
+    write_rows,
+)
+
+
+@pytest.fixture
+def binary_file(example_maze, tmp_path):
+    filename = str(tmp_path / "maze_12_6.maze")
+    example_maze.export_maze(filename)
+    return filename
+
+
+def test_pack_values():
+    values = bytes([0, 1, 2, 3, 3, 2, 1])
+    packed = pack_values(values)
+    assert len(packed) == 2
+    assert unpack_values(packed, len(values)) == values
+
+
+def test_binary_file_size(example_maze, binary_file):
+    with open(binary_file, "rb") as file:
+        content = file.read()
+    assert len(content) == HEADER.size + (example_maze.grid.size + 3) // 4
+
+
+def test_binary_import(example_maze, binary_file):
+    maze = Maze.import_maze(binary_file)
+    assert maze.config == example_maze.config
+    assert maze.starting_point == example_maze.starting_point
+    assert maze.ending_point == example_maze.ending_point
+
+
+def test_mapped_grid(example_maze, binary_file):
+    with MappedGrid(binary_file) as mapped_grid:
+        assert mapped_grid.starting_point == example_maze.starting_point
+        assert mapped_grid.value(*example_maze.ending_point) == 3
+        assert list(mapped_grid.to_grid().values) == list(example_maze.grid.values)
+        with pytest.raises(IndexError):
+            mapped_grid.value(0, 1)
+
+
+def test_read_header_wrong_file():
+    with pytest.raises(ValueError):
+        read_header(b"1 0 1 1 1\n" * 10)
+
+
+def test_binary_import_wrong_header(binary_file):
+    with open(binary_file, "r+b") as file:
+        header = bytearray(file.read(HEADER.size))
+        header[16:24] = bytes(8)
+        file.seek(0)
+        file.write(header)
+    with pytest.raises(InvalidList):
+        Maze.import_maze(binary_file)
+
+
+def test_binary_import_empty_file(tmp_path):
+    filename = tmp_path / "empty.maze"
+    filename.write_bytes(b"")
+    with pytest.raises(ValueError, match="too short"):
+        Maze.import_maze(str(filename))
+
+
+def test_from_grid_invalid(example_maze):
+    grid = example_maze.grid
+    grid.values[grid.values.index(3)] = 1
+    with pytest.raises(InvalidList):
+        Maze.from_grid(grid)
+
+
+def test_decode_row():
+    assert decode_row(b"0 1 2 3") == bytes([0, 1, 2, 3])
+    assert decode_row(b"0,1,12", b",") == bytes([0, 1, 12])
+
+
+def test_decode_row_not_int():
+    with pytest.raises(TypeError):
+        decode_row(b"1 2 ]")
+
+
+def test_read_text(example_maze):
+    grid, starting_point, ending_point = read_text("tests/maze_examples/maze_12_6.txt")
+    assert grid.values == example_maze.grid.values
+    assert starting_point == example_maze.starting_point
+    assert ending_point == example_maze.ending_point
+
+
+@pytest.mark.parametrize("content", ["2 1 3\n1 0\n", "2 1 3\n1 0 5\n", ""])
+def test_read_text_invalid(tmp_path, content):
+    filename = tmp_path / "maze.txt"
+    filename.write_text(content)
+    with pytest.raises(InvalidList):
+        read_text(str(filename))
+
+
+@pytest.mark.parametrize("ending", ["txt", "maze"])
+def test_write_rows(example_maze, tmp_path, ending):
+    filename = str(tmp_path / f"maze.{ending}")
+    grid = example_maze.grid
+    rows = (
+        grid.values[row : row + grid.length] for row in range(0, grid.size, grid.length)
+    )
+    write_rows(filename, rows, grid.width, grid.length)
+    maze = Maze.import_maze(filename)
+    assert maze.config == example_maze.config
+    assert maze.starting_point == example_maze.starting_point
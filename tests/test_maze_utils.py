@@ -7,6 +7,7 @@ from maze.maze_utils import (
     verify_ending,
     verify_file,
     find_value_in_config,
+    compute_key_offsets,
 )
 
 width = 5
@@ -77,3 +78,8 @@ def test_find_value_in_config_1(list_list):
 
 def test_find_value_in_config_2(list_list):
     assert not find_value_in_config(12, list_list)
+
+
+def test_compute_key_offsets():
+    key_numbers = {"1": 3, "1.1": 2, "1.2": 4, "1.2.1": 1}
+    assert compute_key_offsets(key_numbers) == {"1": 0, "1.1": 3, "1.2": 3, "1.2.1": 7}
@@ -0,0 +1,85 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from maze.algorithm import MazeSolver, BFSAlgorithm
+from maze.render import (
+    PALETTE,
+    PATH,
+    VISITED,
+    plot_indices,
+    cell_colours,
+    render_maze,
+    path_frames,
+    write_png,
+    write_frames,
+    write_gif,
+)
+
+
+@pytest.fixture
+def solved_paths(example_maze):
+    maze_solver = MazeSolver(example_maze, BFSAlgorithm)
+    maze_solver.solve_maze()
+    solution_path = plot_indices(example_maze.grid, maze_solver.solution_path)
+    visit_order = plot_indices(example_maze.grid, list(maze_solver.plot_dict("full")))
+    return solution_path, visit_order
+
+
+def test_plot_indices(example_maze, solved_paths):
+    solution_path, _ = solved_paths
+    grid = example_maze.grid
+    assert solution_path[0] == grid.index(*example_maze.starting_point)
+    assert solution_path[-1] == grid.index(*example_maze.ending_point)
+
+
+def test_cell_colours(example_maze, solved_paths):
+    solution_path, visit_order = solved_paths
+    colours = cell_colours(example_maze.grid, solution_path, visit_order)
+    assert colours.shape == (example_maze.width, example_maze.length)
+    assert colours[example_maze.starting_point[0] - 1, 8] == 2
+    assert (colours == PATH).sum() == len(solution_path) - 2
+    assert VISITED < colours.max() < len(PALETTE)
+
+
+def test_render_maze(example_maze):
+    image = render_maze(example_maze.grid, cell_size=3)
+    assert image.shape == (3 * example_maze.width, 3 * example_maze.length, 3)
+    assert (image[:3, :3] == PALETTE[1]).all()
+
+
+def test_path_frames(example_maze, solved_paths):
+    solution_path, visit_order = solved_paths
+    frames = [
+        frame.copy()
+        for frame in path_frames(
+            example_maze.grid, visit_order, 2, frames=4, solution_path=solution_path
+        )
+    ]
+    # the plain maze, four batches and the solution path
+    assert len(frames) == 6
+    assert (frames[-1] == PATH).sum() == 4 * (len(solution_path) - 2)
+
+
+def test_write_png(example_maze, solved_paths, tmp_path):
+    filename = str(tmp_path / "maze.png")
+    write_png(filename, example_maze.grid, 2, *solved_paths)
+    with Image.open(filename) as image:
+        assert image.size == (2 * example_maze.length, 2 * example_maze.width)
+
+
+def test_write_frames(example_maze, solved_paths, tmp_path):
+    solution_path, visit_order = solved_paths
+    filenames = write_frames(
+        str(tmp_path / "frames"), example_maze.grid, visit_order, frames=3
+    )
+    assert len(filenames) == 4
+
+
+def test_write_gif(example_maze, solved_paths, tmp_path):
+    solution_path, visit_order = solved_paths
+    filename = str(tmp_path / "maze.gif")
+    write_gif(filename, example_maze.grid, visit_order, 2, 5, solution_path)
+    with Image.open(filename) as image:
+        assert image.n_frames == 7
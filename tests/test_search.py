@@ -0,0 +1,67 @@
+from maze.search import (
+    UNVISITED,
+    breadth_first_search,
+    breadth_first_distances,
+    best_first_search,
+    bidirectional_search,
+    reconstruct_path,
+    branch_paths,
+)
+
+
+def test_breadth_first_search_order(small_grid):
+    parents, order = breadth_first_search(small_grid, 0)
+    assert list(order) == [0, 3, 1, 6, 2, 5, 8]
+    assert parents[0] == 0 and parents[4] == UNVISITED
+
+
+def test_breadth_first_search_stops_at_target(small_grid):
+    _, order = breadth_first_search(small_grid, 0, 2)
+    assert order[-1] == 2 and 8 not in order
+
+
+def test_breadth_first_distances(small_grid):
+    distances = breadth_first_distances(small_grid, 0)
+    assert list(distances) == [0, 1, 2, 1, -1, 3, 2, -1, 4]
+
+
+def test_reconstruct_path(small_grid):
+    parents, _ = breadth_first_search(small_grid, 0, 8)
+    assert reconstruct_path(parents, 8) == [0, 1, 2, 5, 8]
+
+
+def test_reconstruct_path_unreachable(small_grid):
+    parents, _ = breadth_first_search(small_grid, 0)
+    assert reconstruct_path(parents, 4) == []
+
+
+def test_branch_paths(small_grid):
+    parents, order = breadth_first_search(small_grid, 0)
+    assert branch_paths(parents, order) == {
+        "1": [0],
+        "1.1": [3, 6],
+        "1.2": [1, 2, 5, 8],
+    }
+
+
+def test_best_first_search_a_star(small_grid):
+    parents, order = best_first_search(small_grid, 0, 8)
+    assert reconstruct_path(parents, 8) == [0, 1, 2, 5, 8]
+    assert order[0] == 0 and order[-1] == 8
+
+
+def test_best_first_search_unreachable(small_grid):
+    parents, _ = best_first_search(small_grid, 0, 4, cost_weight=0)
+    assert parents[4] == UNVISITED
+
+
+def test_bidirectional_search(small_grid):
+    forward, backward, meeting, order = bidirectional_search(small_grid, 0, 8)
+    assert reconstruct_path(forward, meeting)[0] == 0
+    assert reconstruct_path(backward, meeting)[0] == 8
+    assert list(order[:2]) == [0, 8]
+
+
+def test_bidirectional_search_unreachable(small_grid):
+    _, _, meeting, _ = bidirectional_search(small_grid, 0, 4)
+    assert meeting == UNVISITED
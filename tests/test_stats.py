@@ -0,0 +1,78 @@
+import tracemalloc
+import pytest
+from maze.maze import Maze
+from maze.algorithm import MazeSolver, BFSAlgorithm, DFSAlgorithm
+from maze.search import breadth_first_search
+from maze.stats import SolveStats, phase
+
+
+def test_record_search(small_grid):
+    stats = SolveStats()
+    stats.record_search(*breadth_first_search(small_grid, 0))
+    assert stats.cells_expanded == 7
+    assert stats.branches == 1
+    assert stats.peak_frontier == 2
+
+
+def test_record_walk():
+    stats = SolveStats()
+    stats.record_walk([0, 1, 2, 1, 3])
+    assert stats.cells_expanded == 4
+    assert stats.branches == 1
+    assert stats.peak_frontier == 3
+
+
+def test_phase_hooks():
+    events = []
+    stats = SolveStats(hooks=[lambda name, stats: events.append(name)])
+    with phase(stats, "solve"):
+        pass
+    assert events == ["solve"] and stats.phases["solve"] >= 0
+
+
+def test_phase_disabled():
+    with phase(None, "solve") as stats:
+        assert stats is None
+
+
+def test_phase_memory():
+    stats = SolveStats(track_memory=True)
+    with phase(stats, "solve"):
+        data = [0] * 100000
+    assert stats.peak_memory >= 8 * len(data)
+
+
+def test_phase_memory_tracing_without_reset_peak(monkeypatch):
+    monkeypatch.delattr(tracemalloc, "reset_peak", raising=False)
+    tracemalloc.start()
+    try:
+        stats = SolveStats(track_memory=True)
+        with phase(stats, "solve"):
+            data = [0] * 100000
+    finally:
+        tracemalloc.stop()
+    assert stats.peak_memory >= 8 * len(data)
+
+
+@pytest.mark.parametrize("algorithm", [BFSAlgorithm, DFSAlgorithm])
+def test_maze_solver_stats(algorithm):
+    stats = SolveStats()
+    maze = Maze.import_maze("tests/maze_examples/maze_12_6.txt", stats=stats)
+    maze_solver = MazeSolver(maze, algorithm)
+    maze_solver.solve_maze()
+    assert maze_solver.stats is stats
+    assert list(stats.phases) == [
+        "import",
+        "validate",
+        "index build",
+        "solve",
+        "path reconstruction",
+    ]
+    assert stats.cells_expanded >= len(maze_solver.solution_path)
+
+
+def test_maze_solver_without_stats():
+    maze = Maze.import_maze("tests/maze_examples/maze_12_6.txt")
+    maze_solver = MazeSolver(maze, BFSAlgorithm)
+    maze_solver.solve_maze()
+    assert maze_solver.stats is None